@@ -3,12 +3,68 @@ AI Job Relevance Classifier
 Uses keyword matching to classify job relevance for AI/ML positions.
 """
 import logging
-import json
-from typing import Dict, List, Optional
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from config import get_settings, JOB_RELEVANCE_CONFIG
 
 
+def _keyword_variant_pattern(keyword: str) -> str:
+    """
+    Regex for one keyword: the whole word or phrase, optionally plural.
+    
+    All-caps acronyms (AI, ML, LLM, ...) also match, case-sensitively, inside
+    a CamelCase compound such as GenAI, MLOps or AIOps: not preceded by
+    another capital (so HTML is not ML) and followed by a word boundary, a
+    plural "s" or a capitalized word part (so AIDE, AIRCRAFT, MLB and AIX
+    are not AI/ML). All-caps compounds like HRBP must be listed explicitly.
+    """
+    escaped = re.escape(keyword)
+    pattern = r"\b" + escaped + r"s?\b"
+    if keyword.isupper() and " " not in keyword:
+        pattern += r"|(?-i:(?<![A-Z])" + escaped + r"(?=[A-Z][a-z]|s?\b))"
+    return pattern
+
+
+def _compile_keyword_pattern(keywords: List[str]) -> Tuple[re.Pattern, Tuple[str, ...]]:
+    """
+    Compile keywords into a single case-insensitive alternation.
+    
+    Returns the pattern and the keywords in group order: each keyword has its
+    own group, so ``names[match.lastindex - 1]`` is the one that matched.
+    """
+    # Longest first so multi-word keywords win over their shorter prefixes
+    names = tuple(sorted(keywords, key=len, reverse=True))
+    pattern = re.compile(
+        "|".join("(" + _keyword_variant_pattern(k) + ")" for k in names),
+        re.IGNORECASE
+    )
+    return pattern, names
+
+
+# Keyword patterns are loop-invariant; build them once at import time
+_KEYWORD_RE, _KEYWORD_NAMES = _compile_keyword_pattern(JOB_RELEVANCE_CONFIG["keywords"])
+_EXCLUDED_RE, _EXCLUDED_NAMES = _compile_keyword_pattern(JOB_RELEVANCE_CONFIG["excluded_keywords"])
+
+
+# Category cues in precedence order. "data scientist" is not listed under
+# Data Science because it always contains "scientist", which wins as Research.
+_CATEGORY_CUES = (
+    ("Research", ("research", "scientist", "paper", "publication")),
+    ("Engineering", ("engineer", "developer", "software", "systems")),
+    ("Data Science", ("analyst",)),
+)
+# One group per category so a single scan reports every category present
+_CATEGORY_RE = re.compile(
+    "|".join(
+        "(" + "|".join(re.escape(w) for w in words) + ")"
+        for _, words in _CATEGORY_CUES
+    ),
+    re.IGNORECASE
+)
+
+
 class JobClassifier:
     """
     Classifies job postings for relevance to AI/ML research and engineering roles.
@@ -22,6 +78,11 @@ class JobClassifier:
         """Initialize job classifier."""
         self.settings = get_settings()
         self.logger = logging.getLogger(__name__)
+        # Plain float snapshot of the threshold checked for every job
+        self._min_score = float(self.settings.min_relevance_score)
+        
+        # Cross-posted jobs repeat the same title/description; classify them once
+        self._classify_cached = lru_cache(maxsize=10000)(self._classify_text)
         
     def classify_job_relevance(self, job: Dict) -> Dict:
         """
@@ -47,72 +108,85 @@ class JobClassifier:
         """
         try:
             title = job.get("title", "")
-            company = job.get("company", "")
             description = job.get("description", "") or ""
             
             if not title:
                 return self._create_rejection_response("Missing job title")
 
-            # Keyword matching logic
-            keywords = JOB_RELEVANCE_CONFIG["keywords"]
-            excluded = JOB_RELEVANCE_CONFIG["excluded_keywords"]
-            
-            text = (title + " " + description).lower()
-            title_lower = title.lower()
-            
-            # Check for excluded keywords first
-            for word in excluded:
-                if word.lower() in title_lower:
-                    return {
-                        "relevance_score": 0.0,
-                        "reasoning": f"Contains excluded keyword in title: {word}",
-                        "category": "Other",
-                        "tags": [],
-                        "is_relevant": False
-                    }
-
-            # Calculate score based on keywords
-            found_keywords = []
-            score = 0.0
-            
-            # Title matches (high weight)
-            for k in keywords:
-                if k.lower() in title_lower:
-                    found_keywords.append(k)
-                    score = max(score, 0.9)
-            
-            # Description matches (medium weight)
-            if score < 0.9:
-                for k in keywords:
-                    if k.lower() in text:
-                        found_keywords.append(k)
-                        score = max(score, 0.7)
-            
-            # Determine category
-            category = "Other"
-            if any(w in text for w in ["research", "scientist", "paper", "publication"]):
-                category = "Research"
-            elif any(w in text for w in ["engineer", "developer", "software", "systems"]):
-                category = "Engineering"
-            elif any(w in text for w in ["data scientist", "analyst"]):
-                category = "Data Science"
-            elif found_keywords:
-                category = "AI/ML"
-
-            is_relevant = score >= self.settings.min_relevance_score
-            
-            return {
-                "relevance_score": score,
-                "reasoning": f"Matched keywords: {', '.join(found_keywords[:5])}" if found_keywords else "No relevant keywords found",
-                "category": category,
-                "tags": found_keywords,
-                "is_relevant": is_relevant
-            }
+            result = self._classify_cached(title, description)
+            # Hand out a copy so callers never mutate a cached entry
+            return {**result, "tags": list(result["tags"])}
         
         except Exception as e:
             self.logger.error(f"Error classifying job: {e}", exc_info=True)
             return self._create_rejection_response(f"Classification error: {str(e)}")
 
+    def _classify_text(self, title: str, description: str) -> Dict:
+        """
+        Score a title/description pair against the keyword configuration.
+        Pure function of its arguments, so results are memoized per classifier.
+        """
+        text = title + " " + description
+        
+        # Check for excluded keywords first
+        excluded_match = _EXCLUDED_RE.search(title)
+        if excluded_match:
+            word = _EXCLUDED_NAMES[excluded_match.lastindex - 1]
+            return {
+                "relevance_score": 0.0,
+                "reasoning": f"Contains excluded keyword in title: {word}",
+                "category": "Other",
+                "tags": [],
+                "is_relevant": False
+            }
+
+        # Calculate score based on keywords
+        score = 0.0
+        
+        # Title matches (high weight)
+        found_keywords = self._find_keywords(title)
+        if found_keywords:
+            score = 0.9
+        else:
+            # Description matches (medium weight); the title is known to have no hits
+            found_keywords = self._find_keywords(description)
+            if found_keywords:
+                score = 0.7
+        
+        # Determine category
+        category = self._detect_category(text)
+        if category is None:
+            category = "AI/ML" if found_keywords else "Other"
+
+        is_relevant = score >= self._min_score
+        
+        return {
+            "relevance_score": score,
+            "reasoning": f"Matched keywords: {', '.join(found_keywords[:5])}" if found_keywords else "No relevant keywords found",
+            "category": category,
+            "tags": found_keywords,
+            "is_relevant": is_relevant
+        }
+
+    def _find_keywords(self, text: str) -> List[str]:
+        """Return the configured keywords found in text, deduplicated in match order."""
+        return list(dict.fromkeys(
+            _KEYWORD_NAMES[match.lastindex - 1]
+            for match in _KEYWORD_RE.finditer(text)
+        ))
+
+    def _detect_category(self, text: str) -> Optional[str]:
+        """Return the highest-precedence category cued in text, if any."""
+        best = None
+        for match in _CATEGORY_RE.finditer(text):
+            rank = match.lastindex - 1
+            if rank == 0:
+                # Top-precedence cue; nothing later in the text can outrank it
+                return _CATEGORY_CUES[0][0]
+            if best is None or rank < best:
+                best = rank
+        return _CATEGORY_CUES[best][0] if best is not None else None
+
     def _create_rejection_response(self, reason: str) -> Dict:
         """Create a rejection response for irrelevant jobs."""
         return {
@@ -123,20 +197,16 @@ class JobClassifier:
             "is_relevant": False
         }
     
-    def filter_jobs(self, jobs: List[Dict]) -> List[Dict]:
+    def filter_jobs_iter(self, jobs: Iterable[Dict]) -> Iterator[Dict]:
         """
-        Filter a list of jobs based on relevance classification.
+        Lazily filter jobs based on relevance classification.
         
         Args:
-            jobs: List of job dictionaries
+            jobs: Iterable of job dictionaries
         
-        Returns:
-            List of relevant jobs with added classification metadata
+        Yields:
+            Relevant jobs, with classification metadata added
         """
-        relevant_jobs = []
-        
-        self.logger.info(f"Filtering {len(jobs)} jobs using keyword classification")
-        
         for job in jobs:
             classification = self.classify_job_relevance(job)
             
@@ -144,12 +214,26 @@ class JobClassifier:
             job["classification"] = classification
             
             if classification["is_relevant"]:
-                relevant_jobs.append(job)
+                yield job
             else:
                 self.logger.debug(
                     f"Filtered out job '{job.get('title', 'N/A')}': "
                     f"score={classification['relevance_score']:.2f}"
                 )
+    
+    def filter_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Filter a list of jobs based on relevance classification.
+        
+        Args:
+            jobs: List of job dictionaries
+        
+        Returns:
+            List of relevant jobs with added classification metadata
+        """
+        self.logger.info(f"Filtering {len(jobs)} jobs using keyword classification")
+        
+        relevant_jobs = list(self.filter_jobs_iter(jobs))
         
         self.logger.info(
             f"Filtering complete: {len(relevant_jobs)}/{len(jobs)} jobs relevant "
@@ -157,4 +241,3 @@ class JobClassifier:
         )
         
         return relevant_jobs
-
@@ -3,6 +3,7 @@ Configuration management for AI Jobs Scraper.
 Handles environment variables, crawler settings, and AI filtering config.
 """
 import os
+from functools import lru_cache
 from typing import List
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -18,6 +19,14 @@ class Settings(BaseSettings):
     request_delay: float = Field(default=2.0, description="Delay between requests (seconds)")
     max_retries: int = Field(default=3, description="Maximum retry attempts for failed requests")
     timeout: int = Field(default=30, description="Request timeout in seconds")
+    http_cache_dir: str = Field(
+        default=".cache/http",
+        description="Directory for ETag/Last-Modified cached responses (empty to disable)"
+    )
+    http_cache_max_age_days: float = Field(
+        default=7.0,
+        description="Drop cached responses not used for this many days"
+    )
     
     # Rate Limiting
     respect_robots_txt: bool = Field(default=False, description="Whether to respect robots.txt")
@@ -33,6 +42,7 @@ class Settings(BaseSettings):
     output_dir: str = Field(default="jobs", description="Directory for storing job listings")
     csv_output: bool = Field(default=True, description="Save jobs as CSV")
     markdown_output: bool = Field(default=True, description="Save jobs as Markdown")
+    jsonl_output: bool = Field(default=False, description="Append jobs to a JSON Lines file")
     
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
@@ -54,7 +64,7 @@ JOB_RELEVANCE_CONFIG = {
         "ML Engineer", "AI Engineer", "ML Researcher"
     ],
     "excluded_keywords": [
-        "Sales", "Marketing", "Administrative", "HR",
+        "Sales", "Marketing", "Administrative", "HR", "HRBP",
         "Recruiter", "Account Manager", "Business Development"
     ],
     "required_fields": ["title", "company", "location", "link", "posted_date"]
@@ -66,7 +76,8 @@ CRAWLER_SOURCES = {
     "linkedin": {
         "base_url": "https://www.linkedin.com/jobs/search",
         "enabled": True,
-        "rate_limit_delay": 3.0
+        "rate_limit_delay": 3.0,
+        "max_concurrency": 3
     },
     "glassdoor": {
         "base_url": "https://www.glassdoor.com/Job/jobs.htm",
@@ -91,12 +102,28 @@ CRAWLER_SOURCES = {
     "company_portals": {
         "base_url": "data/companies.json",
         "enabled": True,
-        "rate_limit_delay": 1.0
+        "rate_limit_delay": 1.0,
+        "max_concurrency": 10,  # Companies crawled in parallel
+        "detail_concurrency": 8  # Job detail requests in flight per board
     }
 }
 
 
+# Per-host request caps as (max requests, per seconds), enforced with a token
+# bucket on every fetch so bursts are allowed up to the cap
+HOST_RATE_LIMITS = {
+    "boards-api.greenhouse.io": (10, 1.0),
+    "api.lever.co": (10, 1.0),
+    "remoteok.com": (5, 1.0),
+}
+
+# Process-wide cap across all hosts, stacked on top of the per-host buckets so
+# concurrent crawlers stay within one overall request budget
+GLOBAL_RATE_LIMIT = (20, 1.0)
+
+
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings instance."""
+    """Get the shared application settings instance (parsed from .env once)."""
     return Settings()
 
@@ -2,15 +2,51 @@
 Base Crawler Abstract Class
 Provides common functionality for all job crawlers.
 """
-import time
+import asyncio
+import hashlib
 import logging
+import os
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import ClassVar, List, Dict, Optional, Tuple
 from urllib.robotparser import RobotFileParser
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
+import aiohttp
 import backoff
 
-from config import get_settings, CRAWLER_SOURCES
+from config import get_settings, CRAWLER_SOURCES, GLOBAL_RATE_LIMIT, HOST_RATE_LIMITS
+from utils import json_utils
+from utils.rate_limiter import TokenBucket
+
+_NEGATIVE_SPONSORSHIP_PHRASES = [
+    "sponsorship is not available",
+    "no sponsorship",
+    "cannot sponsor",
+    "unable to sponsor",
+    "must be authorized to work",
+    "us citizens only",
+    "green card holders only"
+]
+
+_POSITIVE_SPONSORSHIP_PHRASES = [
+    "visa sponsorship available",
+    "can sponsor",
+    "willing to sponsor",
+    "sponsorship provided"
+]
+
+# Every phrase above contains one of these; most descriptions contain none,
+# so a few substring checks let us skip the full scan
+_SPONSORSHIP_TRIGGERS = ("sponsor", "authorized", "citizen", "green card")
+
+# All phrases in one alternation so a description is scanned once;
+# the named group tells us which list matched. Matched against the
+# lowercased description, like the triggers
+_SPONSORSHIP_RE = re.compile(
+    "(?P<negative>" + "|".join(map(re.escape, _NEGATIVE_SPONSORSHIP_PHRASES)) + ")"
+    "|(?P<positive>" + "|".join(map(re.escape, _POSITIVE_SPONSORSHIP_PHRASES)) + ")"
+)
 
 
 class BaseCrawler(ABC):
@@ -23,8 +59,28 @@ class BaseCrawler(ABC):
     - Robots.txt respect
     - Error handling
     - Retry logic
+    - A connection pool shared by all crawlers
     """
     
+    # One pooled session for every crawler, so connections, TLS sessions and
+    # DNS lookups are reused across sources within a run
+    _shared_session: ClassVar[Optional[aiohttp.ClientSession]] = None
+    # Event loop the shared session was created on; aiohttp sessions are bound to it
+    _session_loop: ClassVar[Optional[asyncio.AbstractEventLoop]] = None
+    
+    # Parsed robots.txt per robots URL; crawlers are created per run, so this
+    # keeps each host's file from being downloaded and parsed again
+    _robots_cache: ClassVar[Dict[str, RobotFileParser]] = {}
+    
+    # Monotonic time of the last sweep of stale on-disk cache entries
+    _http_cache_pruned_at: ClassVar[Optional[float]] = None
+    
+    # One token bucket per rate-limited host, shared by every crawler
+    _host_limiters: ClassVar[Dict[str, TokenBucket]] = {}
+    
+    # Overall request budget shared by every crawler and host
+    _global_limiter: ClassVar[TokenBucket] = TokenBucket(*GLOBAL_RATE_LIMIT)
+    
     def __init__(self, source_name: str):
         """
         Initialize base crawler.
@@ -34,6 +90,12 @@ class BaseCrawler(ABC):
         """
         self.source_name = source_name
         self.settings = get_settings()
+        # Plain snapshots of settings read on every request
+        self._user_agent = self.settings.user_agent
+        self._timeout = self.settings.timeout
+        self._respect_robots = self.settings.respect_robots_txt
+        self._http_cache_dir = self.settings.http_cache_dir
+        self._http_cache_max_age = self.settings.http_cache_max_age_days * 86400
         self.logger = self._setup_logging()
         self.robot_parser: Optional[RobotFileParser] = None
         
@@ -47,7 +109,7 @@ class BaseCrawler(ABC):
             self.logger.warning(f"Source {source_name} is not enabled")
         
         # Setup robots.txt parser
-        if self.settings.respect_robots_txt:
+        if self._respect_robots:
             self._setup_robots_parser()
     
     def _setup_logging(self) -> logging.Logger:
@@ -55,8 +117,11 @@ class BaseCrawler(ABC):
         logger = logging.getLogger(f"{__name__}.{self.source_name}")
         logger.setLevel(getattr(logging, self.settings.log_level))
         
+        # Loggers are shared per source; only the first crawler attaches handlers
+        if logger.handlers:
+            return logger
+        
         # Create logs directory if it doesn't exist
-        import os
         os.makedirs(os.path.dirname(self.settings.log_file) or ".", exist_ok=True)
         
         # File handler
@@ -85,9 +150,15 @@ class BaseCrawler(ABC):
             base_url = self.source_config["base_url"]
             robots_url = urljoin(base_url, "/robots.txt")
             
+            cached = BaseCrawler._robots_cache.get(robots_url)
+            if cached is not None:
+                self.robot_parser = cached
+                return
+            
             self.robot_parser = RobotFileParser()
             self.robot_parser.set_url(robots_url)
             self.robot_parser.read()
+            BaseCrawler._robots_cache[robots_url] = self.robot_parser
             
             self.logger.info(f"Loaded robots.txt from {robots_url}")
         except Exception as e:
@@ -104,10 +175,10 @@ class BaseCrawler(ABC):
         Returns:
             True if URL can be fetched, False otherwise
         """
-        if not self.settings.respect_robots_txt or not self.robot_parser:
+        if not self._respect_robots or not self.robot_parser:
             return True
         
-        return self.robot_parser.can_fetch(self.settings.user_agent, url)
+        return self.robot_parser.can_fetch(self._user_agent, url)
     
     def validate_config(self) -> bool:
         """
@@ -125,16 +196,191 @@ class BaseCrawler(ABC):
         self.logger.info(f"Configuration validated for {self.source_name}")
         return True
     
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the pooled HTTP session shared by all crawlers, creating it on first use.
+        
+        Reusing one session keeps connections alive across requests and sources
+        instead of paying a new TCP/TLS handshake per request. With the
+        aiohttp speedups extra installed, responses are also negotiated with
+        brotli compression and DNS is resolved through aiodns.
+        """
+        loop = asyncio.get_running_loop()
+        session = BaseCrawler._shared_session
+        if session is not None and not session.closed and BaseCrawler._session_loop is not loop:
+            # Left open by an earlier event loop (e.g. a previous asyncio.run
+            # that skipped close_session); it cannot be used or awaited from
+            # this loop, so drop the reference and open a fresh one
+            self.logger.warning("Shared HTTP session belongs to another event loop; "
+                                "call close_session() before the loop exits")
+            session = None
+        
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                headers={"User-Agent": self._user_agent},
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+                json_serialize=json_utils.dumps,
+                connector=aiohttp.TCPConnector(limit=50, limit_per_host=8, ttl_dns_cache=300)
+            )
+            BaseCrawler._shared_session = session
+            BaseCrawler._session_loop = loop
+        return session
+    
+    @classmethod
+    async def close_session(cls) -> None:
+        """Close the shared HTTP session, if one was opened."""
+        session = BaseCrawler._shared_session
+        if session is not None and not session.closed:
+            await session.close()
+        BaseCrawler._shared_session = None
+        BaseCrawler._session_loop = None
+    
     @backoff.on_exception(
         backoff.expo,
-        Exception,
-        max_tries=3,
-        max_time=300
+        (aiohttp.ClientConnectionError, asyncio.TimeoutError),
+        max_tries=lambda: get_settings().max_retries,
+        max_value=60
     )
-    def _rate_limited_request(self):
-        """Apply rate limiting delay."""
+    async def _fetch(self, url: str, revalidate: bool = False) -> Tuple[int, bytes]:
+        """
+        GET a URL through the pooled session.
+        
+        Only transient network failures (connection errors, timeouts) are
+        retried, with jittered exponential backoff; anything else propagates.
+        
+        Args:
+            url: URL to fetch
+            revalidate: Send the ETag/Last-Modified validators stored on disk
+                from a previous run; a 304 response is served from that copy
+            
+        Returns:
+            Tuple of (HTTP status, raw response body)
+        """
+        session = self._get_session()
+        use_cache = revalidate and bool(self._http_cache_dir)
+        if use_cache:
+            now = time.monotonic()
+            last_pruned = BaseCrawler._http_cache_pruned_at
+            if last_pruned is None or now - last_pruned >= 86400:
+                # At most once a day per process (the scheduler is long-lived)
+                BaseCrawler._http_cache_pruned_at = now
+                await asyncio.to_thread(self._prune_http_cache)
+        cached = await asyncio.to_thread(self._load_cached_response, url) if use_cache else None
+        
+        headers = {}
+        if cached is not None:
+            validators, _ = cached
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+        
+        limiter = self._get_host_limiter(url)
+        if limiter is not None:
+            await limiter.acquire()
+        await BaseCrawler._global_limiter.acquire()
+        
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and cached is not None:
+                return 200, cached[1]
+            
+            body = await response.read()
+            if use_cache and response.status == 200:
+                validators = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+                if validators["etag"] or validators["last_modified"]:
+                    await asyncio.to_thread(self._store_cached_response, url, validators, body)
+            return response.status, body
+    
+    def _get_host_limiter(self, url: str) -> Optional[TokenBucket]:
+        """Get the token bucket for a URL's host, or None if the host is not capped."""
+        host = urlparse(url).hostname
+        limiter = BaseCrawler._host_limiters.get(host)
+        if limiter is None and host in HOST_RATE_LIMITS:
+            limiter = TokenBucket(*HOST_RATE_LIMITS[host])
+            BaseCrawler._host_limiters[host] = limiter
+        return limiter
+    
+    def _cache_path(self, url: str) -> str:
+        """Path prefix of the on-disk cache entry for a URL."""
+        return os.path.join(self._http_cache_dir, hashlib.sha1(url.encode("utf-8")).hexdigest())
+    
+    def _load_cached_response(self, url: str) -> Optional[Tuple[Dict, bytes]]:
+        """Read cached validators and body for a URL, or None if absent/unreadable."""
+        path = self._cache_path(url)
+        try:
+            with open(path + ".json", "rb") as f:
+                validators = json_utils.loads(f.read())
+            with open(path + ".body", "rb") as f:
+                body = f.read()
+            # Mark the entry as in use so _prune_http_cache keeps it
+            os.utime(path + ".json")
+            os.utime(path + ".body")
+            return validators, body
+        except (OSError, ValueError):
+            return None
+    
+    def _prune_http_cache(self) -> None:
+        """Delete cache files not used within http_cache_max_age_days (e.g. jobs that closed)."""
+        cutoff = time.time() - self._http_cache_max_age
+        try:
+            entries = list(os.scandir(self._http_cache_dir))
+        except OSError:
+            return
+        
+        removed = 0
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    removed += 1
+            except OSError:
+                continue
+        if removed:
+            self.logger.debug(f"Pruned {removed} stale HTTP cache files")
+    
+    def _store_cached_response(self, url: str, validators: Dict, body: bytes) -> None:
+        """Persist validators and body for a URL; failures only cost a cache miss."""
+        path = self._cache_path(url)
+        try:
+            os.makedirs(self._http_cache_dir, exist_ok=True)
+            # Body first, so validators never point at a missing or stale body
+            with open(path + ".body.tmp", "wb") as f:
+                f.write(body)
+            os.replace(path + ".body.tmp", path + ".body")
+            with open(path + ".json.tmp", "w", encoding="utf-8") as f:
+                f.write(json_utils.dumps(validators))
+            os.replace(path + ".json.tmp", path + ".json")
+        except OSError as e:
+            self.logger.debug(f"Could not cache response for {url}: {e}")
+    
+    async def _rate_limited_request(self) -> None:
+        """Apply rate limiting delay without blocking the event loop."""
         delay = self.source_config.get("rate_limit_delay", self.settings.request_delay)
-        time.sleep(delay)
+        await asyncio.sleep(delay)
+    
+    def _check_sponsorship(self, description: str) -> Optional[str]:
+        """Check description for sponsorship information."""
+        if not description:
+            return None
+            
+        desc_lower = description.lower()
+        if not any(trigger in desc_lower for trigger in _SPONSORSHIP_TRIGGERS):
+            return None
+        
+        found_positive = False
+        for match in _SPONSORSHIP_RE.finditer(desc_lower):
+            # A negative phrase anywhere wins over a positive one
+            if match.lastgroup == "negative":
+                return "Sponsorship likely NOT available"
+            found_positive = True
+        
+        if found_positive:
+            return "Sponsorship likely available"
+                
+        return None
     
     def _handle_errors(self, error: Exception, context: Optional[str] = None) -> None:
         """
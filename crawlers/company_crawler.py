@@ -2,14 +2,30 @@
 Company Portal Crawler
 Scrapes job postings directly from company career pages (Greenhouse, Lever, etc.).
 """
-import json
+import asyncio
 import logging
-import aiohttp
-from typing import List, Dict, Optional
+import re
+from typing import ClassVar, List, Dict, Optional, Tuple
 from datetime import datetime
 import os
 
 from crawlers.base_crawler import BaseCrawler
+from utils import json_utils
+
+# Whole markdown lines mentioning a likely job title, found in one scan of the page
+_JOB_TITLE_LINE_RE = re.compile(
+    r"^.*(?:engineer|scientist|developer|researcher|analyst).*$",
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Lever list items arrive as <li>...</li>; both tags are rewritten in a single pass
+_LEVER_LI_REPLACEMENTS = {"<li>": "- ", "</li>": "\n"}
+_LEVER_LI_RE = re.compile("|".join(map(re.escape, _LEVER_LI_REPLACEMENTS)))
+
+def _load_json_file(path: str):
+    """Read and decode a JSON file (run via asyncio.to_thread to keep the loop free)."""
+    with open(path, 'rb') as f:
+        return json_utils.loads(f.read())
 
 class CompanyCrawler(BaseCrawler):
     """
@@ -18,11 +34,18 @@ class CompanyCrawler(BaseCrawler):
     Also supports custom URLs via crawl4ai.
     """
     
+    # Greenhouse descriptions keyed by (board, job id, updated_at), kept for the
+    # life of the process so repeated crawls skip unchanged detail requests
+    _greenhouse_detail_cache: ClassVar[Dict[Tuple[str, int, str], str]] = {}
+    _greenhouse_detail_cache_size: ClassVar[int] = 20000
+    
     def __init__(self):
         """Initialize Company crawler."""
         super().__init__("company_portals")
         self.companies_file = self.source_config.get("base_url", "data/companies.json")
         self.custom_urls_file = "data/custom_urls.json"
+        self.max_concurrency = self.source_config.get("max_concurrency", 10)
+        self.detail_concurrency = self.source_config.get("detail_concurrency", 8)
         
     async def crawl(self, search_params: Optional[Dict] = None) -> List[Dict]:
         """
@@ -39,22 +62,23 @@ class CompanyCrawler(BaseCrawler):
         # Crawl standard companies (Greenhouse/Lever)
         if os.path.exists(self.companies_file):
             try:
-                with open(self.companies_file, 'r') as f:
-                    companies = json.load(f)
+                companies = await asyncio.to_thread(_load_json_file, self.companies_file)
                 
                 self.logger.info(f"Found {len(companies)} companies to crawl")
 
-                async with aiohttp.ClientSession() as session:
-                    for company in companies:
-                        try:
-                            # Rate limiting
-                            self._rate_limited_request()
-                            
-                            company_jobs = await self._crawl_company(session, company)
-                            self.logger.info(f"Found {len(company_jobs)} jobs at {company['name']}")
-                            jobs.extend(company_jobs)
-                        except Exception as e:
-                            self.logger.error(f"Error crawling {company.get('name')}: {e}")
+                # Companies are independent; crawl them concurrently, bounded
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                results = await asyncio.gather(
+                    *(self._crawl_company_bounded(semaphore, company) for company in companies),
+                    return_exceptions=True
+                )
+                
+                for company, company_jobs in zip(companies, results):
+                    if isinstance(company_jobs, Exception):
+                        self.logger.error(f"Error crawling {company.get('name')}: {company_jobs}")
+                        continue
+                    self.logger.info(f"Found {len(company_jobs)} jobs at {company['name']}")
+                    jobs.extend(company_jobs)
             except Exception as e:
                 self.logger.error(f"Error reading companies file: {e}")
         else:
@@ -63,23 +87,38 @@ class CompanyCrawler(BaseCrawler):
         # Crawl custom URLs
         if os.path.exists(self.custom_urls_file):
             try:
-                with open(self.custom_urls_file, 'r') as f:
-                    custom_urls = json.load(f)
+                custom_urls = await asyncio.to_thread(_load_json_file, self.custom_urls_file)
                 
                 self.logger.info(f"Found {len(custom_urls)} custom URLs to crawl")
                 
-                for item in custom_urls:
-                    try:
-                        custom_jobs = await self._crawl_custom_url(item.get('url'), item.get('name'))
-                        self.logger.info(f"Found {len(custom_jobs)} jobs at {item.get('name')} (Custom URL)")
-                        jobs.extend(custom_jobs)
-                    except Exception as e:
-                        self.logger.error(f"Error crawling custom URL {item.get('name')}: {e}")
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                results = await asyncio.gather(
+                    *(self._crawl_custom_url_bounded(semaphore, item) for item in custom_urls),
+                    return_exceptions=True
+                )
+                
+                for item, custom_jobs in zip(custom_urls, results):
+                    if isinstance(custom_jobs, Exception):
+                        self.logger.error(f"Error crawling custom URL {item.get('name')}: {custom_jobs}")
+                        continue
+                    self.logger.info(f"Found {len(custom_jobs)} jobs at {item.get('name')} (Custom URL)")
+                    jobs.extend(custom_jobs)
             except Exception as e:
                 self.logger.error(f"Error reading custom URLs file: {e}")
         
         return jobs
 
+    async def _crawl_company_bounded(self, semaphore: asyncio.Semaphore, company: Dict) -> List[Dict]:
+        """Crawl a company portal while holding a concurrency slot."""
+        async with semaphore:
+            # Greenhouse/Lever requests are paced per host by the token bucket in _fetch
+            return await self._crawl_company(company)
+
+    async def _crawl_custom_url_bounded(self, semaphore: asyncio.Semaphore, item: Dict) -> List[Dict]:
+        """Crawl a custom URL while holding a concurrency slot."""
+        async with semaphore:
+            return await self._crawl_custom_url(item.get('url'), item.get('name'))
+
     async def _crawl_custom_url(self, url: str, name: str) -> List[Dict]:
         """Crawl a custom URL using crawl4ai."""
         jobs = []
@@ -91,24 +130,24 @@ class CompanyCrawler(BaseCrawler):
                 # Simple heuristic: look for lines with "Apply" or known job titles
                 # This is very basic and might need improvement
                 if result.markdown:
-                    for line in result.markdown.split('\n'):
-                        # Basic filtering for potential job titles
-                        if any(keyword in line.lower() for keyword in ["engineer", "scientist", "developer", "researcher", "analyst"]):
-                            jobs.append({
-                                "title": line.strip(),
-                                "company": name,
-                                "url": url,
-                                "description": "Scraped from custom URL",
-                                "date_posted": datetime.now().isoformat(),
-                                "source": "custom_url"
-                            })
+                    date_posted = datetime.now().isoformat()
+                    # Basic filtering for potential job titles
+                    for match in _JOB_TITLE_LINE_RE.finditer(result.markdown):
+                        jobs.append({
+                            "title": match.group().strip(),
+                            "company": name,
+                            "url": url,
+                            "description": "Scraped from custom URL",
+                            "date_posted": date_posted,
+                            "source": "custom_url"
+                        })
         except ImportError:
             self.logger.error("crawl4ai not installed. Cannot crawl custom URLs.")
         except Exception as e:
             self.logger.error(f"Error crawling custom URL {url}: {e}")
         return jobs
 
-    async def _crawl_company(self, session: aiohttp.ClientSession, company: Dict) -> List[Dict]:
+    async def _crawl_company(self, company: Dict) -> List[Dict]:
         """Crawl a single company portal using its API."""
         board_token = company['id']  # This was 'url' before, now it's the board identifier
         ats = company.get('ats')
@@ -118,9 +157,9 @@ class CompanyCrawler(BaseCrawler):
         
         try:
             if ats == 'greenhouse':
-                return await self._fetch_greenhouse_jobs(session, board_token, name)
+                return await self._fetch_greenhouse_jobs(board_token, name)
             elif ats == 'lever':
-                return await self._fetch_lever_jobs(session, board_token, name)
+                return await self._fetch_lever_jobs(board_token, name)
             else:
                 self.logger.warning(f"Unknown ATS {ats} for {name}")
                 return []
@@ -128,142 +167,163 @@ class CompanyCrawler(BaseCrawler):
             self.logger.error(f"Request failed for {name}: {e}")
             return []
 
-    async def _fetch_greenhouse_jobs(self, session: aiohttp.ClientSession, board_token: str, company_name: str) -> List[Dict]:
+    async def _fetch_greenhouse_jobs(self, board_token: str, company_name: str) -> List[Dict]:
         """Fetch jobs from Greenhouse API."""
-        url = f"https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs?content=true"
+        # Descriptions come from the per-job detail endpoint, so skip ?content=true
+        # and keep the list payload down to the fields we actually read
+        url = f"https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs"
         jobs = []
         
         try:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    self.logger.warning(f"Greenhouse API error for {company_name}: {response.status}")
-                    return []
+            status, body = await self._fetch(url, revalidate=True)
+            if status != 200:
+                self.logger.warning(f"Greenhouse API error for {company_name}: {status}")
+                return []
                 
-                data = await response.json()
+            data = json_utils.loads(body)
                 
-                for job in data.get('jobs', []):
-                    # Greenhouse API with content=true returns the description in 'content'
-                    # However, the standard list endpoint might not return full content even with the parameter
-                    # We might need to fetch individual job details if content is missing
-                    description = job.get('content')
-                    
-                    # If content is not in the list response, we might need to fetch it individually
-                    # But for now, let's try to use what we have or fetch detail if needed.
-                    # Based on inspection, the list endpoint DOES NOT return content by default.
-                    # We need to fetch individual job details.
-                    
-                    job_id = job.get('id')
-                    if job_id:
-                         # Fetch details for each job to get the full description and metadata
-                         try:
-                             detail_url = f"https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs/{job_id}"
-                             async with session.get(detail_url) as detail_response:
-                                 if detail_response.status == 200:
-                                     detail_data = await detail_response.json()
-                                     
-                                     # Start with the main content
-                                     parts = [detail_data.get('content', '')]
-                                     
-                                     # Add metadata (e.g., Workplace Type, Employment Type)
-                                     metadata = detail_data.get('metadata', [])
-                                     if metadata:
-                                         parts.append("\n\n### Additional Information:")
-                                         for item in metadata:
-                                             name = item.get('name')
-                                             value = item.get('value')
-                                             if name and value:
-                                                 parts.append(f"- {name}: {value}")
-                                     
-                                     # Add compliance info if needed, or other fields
-                                     
-                                     description = "\n".join(filter(None, parts))
-                                     
-                         except Exception as e:
-                             self.logger.warning(f"Failed to fetch details for Greenhouse job {job_id}: {e}")
-
-                    if not description:
-                        description = f"Job at {company_name}"
+            listings = data.get('jobs', [])
+            
+            # Based on inspection, the list endpoint does not reliably return content,
+            # so fetch every job's detail (full description and metadata) concurrently,
+            # capped per board so we don't hammer Greenhouse
+            semaphore = asyncio.Semaphore(self.detail_concurrency)
+            details = await asyncio.gather(
+                *(self._fetch_greenhouse_detail(semaphore, board_token, job.get('id'), job.get('updated_at'))
+                  for job in listings)
+            )
+            
+            for job, description in zip(listings, details):
+                if not description:
+                    description = f"Job at {company_name}"
 
-                    jobs.append({
-                        "title": job.get('title'),
-                        "company": company_name,
-                        "location": job.get('location', {}).get('name', 'Remote'),
-                        "link": job.get('absolute_url'),
-                        "posted_date": job.get('updated_at', datetime.now().isoformat()),
-                        "source": "company_portal",
-                        "description": description
-                    })
+                jobs.append({
+                    "title": job.get('title'),
+                    "company": company_name,
+                    "location": job.get('location', {}).get('name', 'Remote'),
+                    "link": job.get('absolute_url'),
+                    "posted_date": job.get('updated_at', datetime.now().isoformat()),
+                    "source": "company_portal",
+                    "description": description
+                })
         except Exception as e:
             self.logger.error(f"Error fetching Greenhouse jobs for {company_name}: {e}")
             
         return jobs
 
-    async def _fetch_lever_jobs(self, session: aiohttp.ClientSession, board_token: str, company_name: str) -> List[Dict]:
+    async def _fetch_greenhouse_detail(self, semaphore: asyncio.Semaphore, board_token: str,
+                                       job_id: Optional[int], updated_at: Optional[str]) -> Optional[str]:
+        """Fetch a single Greenhouse job's full description, including metadata."""
+        if not job_id:
+            return None
+        
+        # The list endpoint reports updated_at, so an unchanged job needs no request
+        cache = CompanyCrawler._greenhouse_detail_cache
+        cache_key = (board_token, job_id, updated_at)
+        if updated_at and cache_key in cache:
+            return cache[cache_key]
+        
+        async with semaphore:
+            try:
+                detail_url = f"https://boards-api.greenhouse.io/v1/boards/{board_token}/jobs/{job_id}"
+                detail_status, detail_body = await self._fetch(detail_url, revalidate=True)
+                if detail_status != 200:
+                    return None
+                
+                detail_data = json_utils.loads(detail_body)
+                
+                # Start with the main content
+                parts = [detail_data.get('content', '')]
+                
+                # Add metadata (e.g., Workplace Type, Employment Type)
+                metadata = detail_data.get('metadata', [])
+                if metadata:
+                    parts.append("\n\n### Additional Information:")
+                    for item in metadata:
+                        name = item.get('name')
+                        value = item.get('value')
+                        if name and value:
+                            parts.append(f"- {name}: {value}")
+                
+                description = "\n".join(filter(None, parts))
+                
+                if updated_at:
+                    if len(cache) >= CompanyCrawler._greenhouse_detail_cache_size:
+                        # Evict the oldest entry (dicts keep insertion order)
+                        del cache[next(iter(cache))]
+                    cache[cache_key] = description
+                return description
+            
+            except Exception as e:
+                self.logger.warning(f"Failed to fetch details for Greenhouse job {job_id}: {e}")
+                return None
+
+    async def _fetch_lever_jobs(self, board_token: str, company_name: str) -> List[Dict]:
         """Fetch jobs from Lever API."""
         url = f"https://api.lever.co/v0/postings/{board_token}"
         jobs = []
         
         try:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    self.logger.warning(f"Lever API error for {company_name}: {response.status}")
-                    return []
+            status, body = await self._fetch(url, revalidate=True)
+            if status != 200:
+                self.logger.warning(f"Lever API error for {company_name}: {status}")
+                return []
                 
-                data = await response.json()
+            data = json_utils.loads(body)
                 
-                for job in data:
-                    # Construct full description from all available fields
-                    parts = []
+            for job in data:
+                # Construct full description from all available fields
+                parts = []
                     
-                    # Opening
-                    if job.get('openingPlain'):
-                        parts.append(job.get('openingPlain'))
-                    elif job.get('opening'):
-                        parts.append(job.get('opening'))
+                # Opening
+                if job.get('openingPlain'):
+                    parts.append(job.get('openingPlain'))
+                elif job.get('opening'):
+                    parts.append(job.get('opening'))
                         
-                    # Main Description
-                    if job.get('descriptionBodyPlain'):
-                        parts.append(job.get('descriptionBodyPlain'))
-                    elif job.get('descriptionPlain'):
-                        parts.append(job.get('descriptionPlain'))
-                    elif job.get('description'):
-                        parts.append(job.get('description'))
+                # Main Description
+                if job.get('descriptionBodyPlain'):
+                    parts.append(job.get('descriptionBodyPlain'))
+                elif job.get('descriptionPlain'):
+                    parts.append(job.get('descriptionPlain'))
+                elif job.get('description'):
+                    parts.append(job.get('description'))
                         
-                    # Lists (Requirements, Responsibilities, etc.)
-                    lists = job.get('lists', [])
-                    if lists:
-                        for item in lists:
-                            title = item.get('text')
-                            content = item.get('content') # This is usually HTML <li>...</li>
-                            if title:
-                                parts.append(f"\n### {title}")
-                            if content:
-                                # Simple cleanup if it's HTML list items
-                                clean_content = content.replace('<li>', '- ').replace('</li>', '\n')
-                                parts.append(clean_content)
+                # Lists (Requirements, Responsibilities, etc.)
+                lists = job.get('lists', [])
+                if lists:
+                    for item in lists:
+                        title = item.get('text')
+                        content = item.get('content') # This is usually HTML <li>...</li>
+                        if title:
+                            parts.append(f"\n### {title}")
+                        if content:
+                            # Simple cleanup if it's HTML list items
+                            clean_content = _LEVER_LI_RE.sub(lambda m: _LEVER_LI_REPLACEMENTS[m.group()], content)
+                            parts.append(clean_content)
 
-                    # Additional Info (Salary, Benefits, etc.)
-                    if job.get('additionalPlain'):
-                        parts.append("\n### Additional Information")
-                        parts.append(job.get('additionalPlain'))
-                    elif job.get('additional'):
-                        parts.append("\n### Additional Information")
-                        parts.append(job.get('additional'))
+                # Additional Info (Salary, Benefits, etc.)
+                if job.get('additionalPlain'):
+                    parts.append("\n### Additional Information")
+                    parts.append(job.get('additionalPlain'))
+                elif job.get('additional'):
+                    parts.append("\n### Additional Information")
+                    parts.append(job.get('additional'))
 
-                    description = "\n\n".join(filter(None, parts))
+                description = "\n\n".join(filter(None, parts))
 
-                    if not description:
-                         description = f"Job at {company_name}"
+                if not description:
+                     description = f"Job at {company_name}"
                          
-                    jobs.append({
-                        "title": job.get('text'),
-                        "company": company_name,
-                        "location": job.get('categories', {}).get('location', 'Remote'),
-                        "link": job.get('hostedUrl'),
-                        "posted_date": datetime.fromtimestamp(job.get('createdAt', 0)/1000).isoformat(),
-                        "source": "company_portal",
-                        "description": description
-                    })
+                jobs.append({
+                    "title": job.get('text'),
+                    "company": company_name,
+                    "location": job.get('categories', {}).get('location', 'Remote'),
+                    "link": job.get('hostedUrl'),
+                    "posted_date": datetime.fromtimestamp(job.get('createdAt', 0)/1000).isoformat(),
+                    "source": "company_portal",
+                    "description": description
+                })
         except Exception as e:
             self.logger.error(f"Error fetching Lever jobs for {company_name}: {e}")
             
@@ -2,13 +2,35 @@
 LinkedIn Job Crawler Implementation
 Scrapes AI/ML job postings from LinkedIn.
 """
-import time
-from typing import List, Dict, Optional
+import asyncio
+import random
+from typing import List, Dict, Iterator, Optional
 from urllib.parse import urlencode, quote
 
 from crawl4ai import AsyncWebCrawler
 from crawlers.base_crawler import BaseCrawler
 
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:  # Fall back to BeautifulSoup below
+    lxml_html = None
+
+
+def _class_xpath(tag: str, css_class: str) -> str:
+    """XPath matching ``tag`` elements whose class list contains ``css_class``."""
+    return (f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), "
+            f"' {css_class} ')]")
+
+
+if lxml_html is not None:
+    _CARD_XPATH = etree.XPath(_class_xpath("div", "job-search-card"))
+    _TITLE_XPATH = etree.XPath(_class_xpath("h3", "base-search-card__title"))
+    _COMPANY_XPATH = etree.XPath(_class_xpath("h4", "base-search-card__subtitle"))
+    _LOCATION_XPATH = etree.XPath(_class_xpath("span", "job-search-card__location"))
+    _LINK_XPATH = etree.XPath(_class_xpath("a", "base-card__full-link"))
+    _DATE_XPATH = etree.XPath(_class_xpath("time", "job-search-card__listdate"))
+
 
 class LinkedInCrawler(BaseCrawler):
     """
@@ -22,6 +44,7 @@ class LinkedInCrawler(BaseCrawler):
         """Initialize LinkedIn crawler."""
         super().__init__("linkedin")
         self.base_url = self.source_config["base_url"]
+        self.max_concurrency = self.source_config.get("max_concurrency", 3)
     
     def _build_search_url(self, keywords: str = "AI Machine Learning", 
                          location: str = "", 
@@ -66,7 +89,7 @@ class LinkedInCrawler(BaseCrawler):
             return None
         
         try:
-            self._rate_limited_request()
+            await self._rate_limited_request()
             
             async with AsyncWebCrawler(verbose=False) as crawler:
                 result = await crawler.arun(url=url)
@@ -85,6 +108,57 @@ class LinkedInCrawler(BaseCrawler):
             self._handle_errors(e, f"crawling {url}")
             return None
     
+    async def _crawl_page_bounded(self, semaphore: asyncio.Semaphore,
+                                  url: str) -> Optional[Dict]:
+        """Crawl a page under the shared semaphore, with a jittered start."""
+        async with semaphore:
+            # Stagger requests so concurrent pages don't arrive in lockstep
+            await asyncio.sleep(self.source_config.get("rate_limit_delay", 3.0) * random.random())
+            self.logger.info(f"Crawling {url}")
+            return await self._crawl_page(url)
+    
+    def _parse_cards_lxml(self, html: str) -> Iterator[Dict]:
+        """Yield raw card fields using lxml and precompiled XPath queries."""
+        tree = lxml_html.fromstring(html)
+        
+        def first_text(xpath, card) -> str:
+            found = xpath(card)
+            return found[0].text_content().strip() if found else "N/A"
+        
+        def first_attr(xpath, card, attr: str) -> str:
+            found = xpath(card)
+            return found[0].get(attr, "") if found else ""
+        
+        for card in _CARD_XPATH(tree):
+            yield {
+                "title": first_text(_TITLE_XPATH, card),
+                "company": first_text(_COMPANY_XPATH, card),
+                "location": first_text(_LOCATION_XPATH, card),
+                "link": first_attr(_LINK_XPATH, card, "href"),
+                "posted_date": first_attr(_DATE_XPATH, card, "datetime"),
+            }
+    
+    def _parse_cards_bs4(self, html: str) -> Iterator[Dict]:
+        """Yield raw card fields using BeautifulSoup (used when lxml is missing)."""
+        from bs4 import BeautifulSoup
+        
+        soup = BeautifulSoup(html, "html.parser")
+        
+        for card in soup.find_all("div", {"class": "job-search-card"}):
+            title_elem = card.find("h3", {"class": "base-search-card__title"})
+            company_elem = card.find("h4", {"class": "base-search-card__subtitle"})
+            location_elem = card.find("span", {"class": "job-search-card__location"})
+            link_elem = card.find("a", {"class": "base-card__full-link"})
+            date_elem = card.find("time", {"class": "job-search-card__listdate"})
+            
+            yield {
+                "title": title_elem.get_text(strip=True) if title_elem else "N/A",
+                "company": company_elem.get_text(strip=True) if company_elem else "N/A",
+                "location": location_elem.get_text(strip=True) if location_elem else "N/A",
+                "link": link_elem.get("href", "") if link_elem else "",
+                "posted_date": date_elem.get("datetime", "") if date_elem else "",
+            }
+    
     def extract_jobs(self, raw_data: Dict) -> List[Dict]:
         """
         Extract job listings from LinkedIn page HTML.
@@ -98,52 +172,20 @@ class LinkedInCrawler(BaseCrawler):
         jobs = []
         
         try:
-            from bs4 import BeautifulSoup
-            
             html = raw_data.get("html", "")
             if not html:
                 return jobs
             
-            soup = BeautifulSoup(html, "html.parser")
-            
             # LinkedIn job listing structure (may need adjustment based on actual HTML)
-            job_cards = soup.find_all("div", {"class": "job-search-card"})
+            if lxml_html is not None:
+                cards = self._parse_cards_lxml(html)
+            else:
+                cards = self._parse_cards_bs4(html)
             
-            for card in job_cards:
-                try:
-                    # Extract job title
-                    title_elem = card.find("h3", {"class": "base-search-card__title"})
-                    title = title_elem.get_text(strip=True) if title_elem else "N/A"
-                    
-                    # Extract company name
-                    company_elem = card.find("h4", {"class": "base-search-card__subtitle"})
-                    company = company_elem.get_text(strip=True) if company_elem else "N/A"
-                    
-                    # Extract location
-                    location_elem = card.find("span", {"class": "job-search-card__location"})
-                    location = location_elem.get_text(strip=True) if location_elem else "N/A"
-                    
-                    # Extract job link
-                    link_elem = card.find("a", {"class": "base-card__full-link"})
-                    link = link_elem.get("href", "") if link_elem else ""
-                    
-                    # Extract posted date
-                    date_elem = card.find("time", {"class": "job-search-card__listdate"})
-                    posted_date = date_elem.get("datetime", "") if date_elem else ""
-                    
-                    if title and link:
-                        jobs.append({
-                            "title": title,
-                            "company": company,
-                            "location": location,
-                            "link": link,
-                            "posted_date": posted_date,
-                            "source": "linkedin"
-                        })
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error extracting job from card: {e}")
-                    continue
+            for card in cards:
+                if card["title"] and card["link"]:
+                    card["source"] = "linkedin"
+                    jobs.append(card)
             
             self.logger.info(f"Extracted {len(jobs)} jobs from LinkedIn")
             
@@ -183,23 +225,22 @@ class LinkedInCrawler(BaseCrawler):
             search_url = self._build_search_url(keywords, location, date_posted)
             self.logger.info(f"Starting LinkedIn crawl: {search_url}")
             
-            # Crawl pages
-            for page in range(max_pages):
-                page_url = f"{search_url}&start={page * 25}"  # LinkedIn shows 25 jobs per page
-                
-                self.logger.info(f"Crawling page {page + 1}/{max_pages}")
-                
-                raw_data = await self._crawl_page(page_url)
-                
+            # LinkedIn shows 25 jobs per page
+            page_urls = [f"{search_url}&start={page * 25}" for page in range(max_pages)]
+            
+            # Crawl pages concurrently, a few at a time
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            raw_pages = await asyncio.gather(
+                *(self._crawl_page_bounded(semaphore, url) for url in page_urls)
+            )
+            
+            for page, raw_data in enumerate(raw_pages):
                 if raw_data:
-                    jobs = self.extract_jobs(raw_data)
+                    # Parsing is CPU-bound; run it in a worker thread so other crawlers keep going
+                    jobs = await asyncio.to_thread(self.extract_jobs, raw_data)
                     all_jobs.extend(jobs)
                 else:
                     self.logger.warning(f"Failed to crawl page {page + 1}")
-                
-                # Additional delay between pages
-                if page < max_pages - 1:
-                    time.sleep(self.source_config.get("rate_limit_delay", 3.0))
             
             self.logger.info(f"LinkedIn crawl completed: {len(all_jobs)} jobs found")
             
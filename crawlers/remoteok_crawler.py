@@ -2,9 +2,9 @@
 RemoteOK Job Crawler Implementation
 Scrapes job postings from RemoteOK API.
 """
-import aiohttp
 from typing import List, Dict, Optional
 from crawlers.base_crawler import BaseCrawler
+from utils import json_utils
 
 class RemoteOKCrawler(BaseCrawler):
     """
@@ -30,18 +30,22 @@ class RemoteOKCrawler(BaseCrawler):
         self.logger.info("Starting RemoteOK crawl...")
         
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {"User-Agent": self.settings.user_agent}
-                async with session.get(self.base_url, headers=headers) as response:
-                    if response.status != 200:
-                        self.logger.error(f"Failed to fetch RemoteOK API: {response.status}")
-                        return []
-                    
-                    data = await response.json()
-                    jobs = self.extract_jobs(data)
-                    self.logger.info(f"Found {len(jobs)} jobs from RemoteOK")
-                    return jobs
-                    
+            # Revalidate against the feed stored by the last run; an unchanged
+            # feed comes back as a 304 with no payload
+            status, body = await self._fetch(self.base_url, revalidate=True)
+            if status != 200:
+                self.logger.error(f"Failed to fetch RemoteOK API: {status}")
+                return []
+            
+            data = json_utils.loads(body)
+            # Drop the raw feed bytes before building jobs so both copies
+            # of the (multi-MB) feed are not held at once
+            del body
+            jobs = self.extract_jobs(data)
+            del data
+            self.logger.info(f"Found {len(jobs)} jobs from RemoteOK")
+            return jobs
+                
         except Exception as e:
             self.logger.error(f"Error crawling RemoteOK: {e}", exc_info=True)
             return []
@@ -99,37 +103,3 @@ class RemoteOKCrawler(BaseCrawler):
                 continue
                 
         return jobs
-
-    def _check_sponsorship(self, description: str) -> Optional[str]:
-        """Check description for sponsorship information."""
-        if not description:
-            return None
-            
-        desc_lower = description.lower()
-        
-        negative_phrases = [
-            "sponsorship is not available",
-            "no sponsorship",
-            "cannot sponsor",
-            "unable to sponsor",
-            "must be authorized to work",
-            "us citizens only",
-            "green card holders only"
-        ]
-        
-        positive_phrases = [
-            "visa sponsorship available",
-            "can sponsor",
-            "willing to sponsor",
-            "sponsorship provided"
-        ]
-        
-        for phrase in negative_phrases:
-            if phrase in desc_lower:
-                return "Sponsorship likely NOT available"
-                
-        for phrase in positive_phrases:
-            if phrase in desc_lower:
-                return "Sponsorship likely available"
-                
-        return None
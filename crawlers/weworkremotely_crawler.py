@@ -2,8 +2,12 @@
 We Work Remotely Job Crawler Implementation
 Scrapes job postings from We Work Remotely RSS feed.
 """
-import aiohttp
-from typing import List, Dict, Optional
+import asyncio
+from io import BytesIO
+from typing import List, Dict, Optional, Union
+
+from lxml import etree
+
 from crawlers.base_crawler import BaseCrawler
 
 class WeWorkRemotelyCrawler(BaseCrawler):
@@ -35,51 +39,51 @@ class WeWorkRemotelyCrawler(BaseCrawler):
             # For now, let's use the main remote jobs feed or a specific category if available.
             # The base_url in config should point to the RSS feed.
             
-            async with aiohttp.ClientSession() as session:
-                headers = {"User-Agent": self.settings.user_agent}
-                async with session.get(self.base_url, headers=headers) as response:
-                    if response.status != 200:
-                        self.logger.error(f"Failed to fetch We Work Remotely RSS: {response.status}")
-                        return []
-                    
-                    content = await response.text()
-                    jobs = self.extract_jobs(content)
-                    self.logger.info(f"Found {len(jobs)} jobs from We Work Remotely")
-                    return jobs
-                    
+            # The feed changes a few times a day; revalidate against the copy from the
+            # last run so an unchanged feed costs a 304 instead of a full download
+            status, body = await self._fetch(self.base_url, revalidate=True)
+            if status != 200:
+                self.logger.error(f"Failed to fetch We Work Remotely RSS: {status}")
+                return []
+            
+            # Parsing is CPU-bound; run it in a worker thread so other crawlers keep going.
+            # The raw bytes go straight to the parser, which honours the feed's encoding
+            jobs = await asyncio.to_thread(self.extract_jobs, body)
+            self.logger.info(f"Found {len(jobs)} jobs from We Work Remotely")
+            return jobs
+                
         except Exception as e:
             self.logger.error(f"Error crawling We Work Remotely: {e}", exc_info=True)
             return []
 
-    def extract_jobs(self, raw_data: str) -> List[Dict]:
+    def extract_jobs(self, raw_data: Union[bytes, str]) -> List[Dict]:
         """
         Extract structured job data from RSS XML content.
         
         Args:
-            raw_data: XML string from RSS feed
+            raw_data: RSS feed XML, as raw bytes or a string
             
         Returns:
             List of normalized job dictionaries
         """
         jobs = []
         
+        if isinstance(raw_data, str):
+            raw_data = raw_data.encode("utf-8")
+        
         try:
-            # Use feedparser if available, otherwise fallback to simple parsing or BS4
-            # Since we didn't add feedparser to requirements, let's use BS4 with xml parser
-            from bs4 import BeautifulSoup
-            
-            soup = BeautifulSoup(raw_data, "xml")
-            items = soup.find_all("item")
+            # Stream <item> elements with lxml instead of building a full DOM
+            context = etree.iterparse(BytesIO(raw_data), events=("end",), tag="item", recover=True)
             
-            for item in items:
+            for _, item in context:
                 try:
-                    title_full = item.find("title").text if item.find("title") else "N/A"
+                    title_full = item.findtext("title", "N/A")
                     # Title often comes as "Company: Role" or "Role: Company"
                     # WWR format: "Role: Company" or just "Role"
                     
-                    description = item.find("description").text if item.find("description") else ""
-                    link = item.find("link").text if item.find("link") else ""
-                    pub_date = item.find("pubDate").text if item.find("pubDate") else ""
+                    description = item.findtext("description", "")
+                    link = item.findtext("link", "")
+                    pub_date = item.findtext("pubDate", "")
                     
                     # Try to extract company from title if possible, or description
                     # WWR RSS titles are usually "Job Title at Company Name" or "Company Name: Job Title"
@@ -105,42 +109,13 @@ class WeWorkRemotelyCrawler(BaseCrawler):
                 except Exception as e:
                     self.logger.warning(f"Error extracting job item: {e}")
                     continue
+                finally:
+                    # Free the parsed item and any earlier siblings to keep memory flat
+                    item.clear()
+                    while item.getprevious() is not None:
+                        del item.getparent()[0]
                     
         except Exception as e:
              self.logger.error(f"Error parsing XML: {e}")
              
         return jobs
-
-    def _check_sponsorship(self, description: str) -> Optional[str]:
-        """Check description for sponsorship information."""
-        if not description:
-            return None
-            
-        desc_lower = description.lower()
-        
-        negative_phrases = [
-            "sponsorship is not available",
-            "no sponsorship",
-            "cannot sponsor",
-            "unable to sponsor",
-            "must be authorized to work",
-            "us citizens only",
-            "green card holders only"
-        ]
-        
-        positive_phrases = [
-            "visa sponsorship available",
-            "can sponsor",
-            "willing to sponsor",
-            "sponsorship provided"
-        ]
-        
-        for phrase in negative_phrases:
-            if phrase in desc_lower:
-                return "Sponsorship likely NOT available"
-                
-        for phrase in positive_phrases:
-            if phrase in desc_lower:
-                return "Sponsorship likely available"
-                
-        return None
@@ -3,15 +3,21 @@ Job Entry and Storage Management.
 Handles data models and file I/O for job listings.
 """
 import csv
+import hashlib
+import itertools
 import json
+import operator
 import os
 import re
-from dataclasses import dataclass, asdict
+import struct
+from collections import defaultdict, deque
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import List, Dict, Optional
-import pandas as pd
+from typing import List, Dict, Optional, Set, Tuple
 
-@dataclass
+from utils import json_utils
+
+@dataclass(slots=True)
 class JobEntry:
     """Data model for a single job entry."""
     title: str
@@ -52,9 +58,69 @@ class JobEntry:
             is_relevant=classification.get("is_relevant", False)
         )
     
+    def apply_classification(self, classification: Dict) -> None:
+        """Copy classifier output onto an entry built before classification."""
+        self.relevance_score = classification.get("relevance_score", 0.0)
+        self.reasoning = classification.get("reasoning", "")
+        self.category = classification.get("category", "Other")
+        self.tags = classification.get("tags", [])
+        self.is_relevant = classification.get("is_relevant", False)
+    
     def to_dict(self) -> Dict:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary (shallow; tags is copied so callers can't mutate the entry)."""
+        row = {name: getattr(self, name) for name in _JOB_FIELD_NAMES}
+        row["tags"] = list(self.tags)
+        return row
+
+
+# Field names in declaration order; dataclasses.asdict would also deep-copy
+# every value, which is wasted work for these flat records
+_JOB_FIELD_NAMES = tuple(field.name for field in fields(JobEntry))
+
+# Column order for per-run CSVs, chosen for readability
+_CSV_COLUMNS = (
+    "title", "company", "salary", "location", "posted_date",
+    "link", "source", "relevance_score", "category",
+    "reasoning", "tags", "is_relevant"
+)
+
+
+# Generated jobs table in README.md sits between these markers
+_README_START_MARKER = "<!-- JOBS_TABLE_START -->"
+_README_END_MARKER = "<!-- JOBS_TABLE_END -->"
+_README_TABLE_RE = re.compile(
+    f"{re.escape(_README_START_MARKER)}.*?{re.escape(_README_END_MARKER)}", re.DOTALL
+)
+
+# Pipes would break the README markdown table
+_PIPE_ESCAPE = str.maketrans({"|": "-"})
+
+
+def _company_key(job: JobEntry) -> str:
+    """Sort/group key for reports; some sources (e.g. RemoteOK) leave company as None."""
+    return job.company or ""
+
+
+def _hash_link(link: Optional[str]) -> int:
+    """Stable 64-bit hash of a job link, used for master CSV de-duplication."""
+    digest = hashlib.blake2b((link or "").encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+# master_links.bin starts with a fingerprint of the master CSV it was synced
+# with (file size, SHA-1 of its last bytes), followed by one "<Q" hash per link.
+# Unlike mtimes, the fingerprint survives a fresh git checkout.
+_LINK_SIDECAR_HEADER = struct.Struct("<Q20s")
+_FINGERPRINT_TAIL_BYTES = 4096
+
+
+def _csv_fingerprint(path: str) -> bytes:
+    """Sidecar header identifying the current contents of a CSV file."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        f.seek(max(0, size - _FINGERPRINT_TAIL_BYTES))
+        tail = f.read()
+    return _LINK_SIDECAR_HEADER.pack(size, hashlib.sha1(tail).digest())
 
 
 class JobStorage:
@@ -62,6 +128,13 @@ class JobStorage:
     
     def __init__(self, output_dir: str = "jobs"):
         self.output_dir = output_dir
+        # 8-byte hashes of every link in master_jobs.csv, loaded on first save
+        self._link_hashes: Optional[Set[int]] = None
+        # Whether master_links.bin matches the CSV and can simply be appended to
+        self._link_hashes_synced = False
+        # Rows repeating an earlier link, found when the sidecar had to be rebuilt
+        self._master_duplicates = 0
+        self._link_hashes_path = os.path.join(output_dir, "master_links.bin")
         self._ensure_directories()
         
     def _ensure_directories(self):
@@ -82,62 +155,216 @@ class JobStorage:
             
         filepath = os.path.join(self.output_dir, folder, filename)
         
-        df = pd.DataFrame([job.to_dict() for job in jobs])
+        # Description is left out to keep the CSV lightweight
+        get_row = operator.attrgetter(*_CSV_COLUMNS)
+        with open(filepath, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(_CSV_COLUMNS)
+            writer.writerows(map(get_row, jobs))
+        return filepath
+
+    def save_jobs_master_csv(self, jobs: List[JobEntry]) -> str:
+        """
+        Append jobs whose link is not already in the master CSV.
         
-        # Reorder columns for better readability
-        columns = [
-            "title", "company", "salary", "location", "posted_date", 
-            "link", "source", "relevance_score", "category", 
-            "reasoning", "tags", "is_relevant"
+        Known links are tracked as 8-byte hashes in a sidecar file, so a save
+        only touches the new rows instead of re-reading and rewriting the
+        whole master file.
+        """
+        filepath = os.path.join(self.output_dir, "master_jobs.csv")
+        link_hashes = self._load_link_hashes(filepath)
+        if self._master_duplicates:
+            # Rows were appended to the CSV outside this class; this write
+            # path is the place to clean them up
+            self.compact_master_csv()
+            link_hashes = self._link_hashes
+        
+        new_jobs = []
+        new_hashes = []
+        for job in jobs:
+            link_hash = _hash_link(job.link)
+            if link_hash not in link_hashes:
+                link_hashes.add(link_hash)
+                new_hashes.append(link_hash)
+                new_jobs.append(job)
+        
+        if os.path.exists(filepath):
+            # Keep the column order the existing file was written with
+            with open(filepath, "r", newline="", encoding="utf-8") as f:
+                header = next(csv.reader(f), None)
+        else:
+            header = None
+        
+        if header:
+            if new_jobs:
+                with open(filepath, "a", newline="", encoding="utf-8") as f:
+                    writer = csv.DictWriter(f, fieldnames=header, extrasaction="ignore", lineterminator="\n")
+                    writer.writerows(job.to_dict() for job in new_jobs)
+        else:
+            with open(filepath, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=_JOB_FIELD_NAMES, lineterminator="\n")
+                writer.writeheader()
+                writer.writerows(job.to_dict() for job in new_jobs)
+        
+        if not self._link_hashes_synced:
+            self._write_link_hashes(filepath, link_hashes)
+        elif new_hashes:
+            with open(self._link_hashes_path, "r+b") as f:
+                f.seek(0, os.SEEK_END)
+                f.write(struct.pack(f"<{len(new_hashes)}Q", *new_hashes))
+                f.seek(0)
+                f.write(_csv_fingerprint(filepath))
+        
+        return filepath
+
+    def filter_new_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Drop job dicts whose link is already in the master CSV.
+        
+        Uses the same link-hash set as save_jobs_master_csv, so postings seen
+        in earlier runs can be skipped before classification. Read-only: the
+        master CSV and its sidecar are only rewritten by save_jobs_master_csv.
+        """
+        link_hashes = self._load_link_hashes(os.path.join(self.output_dir, "master_jobs.csv"))
+        # Jobs without a link (e.g. custom-URL jobs) all hash alike, so they
+        # cannot be recognised as seen and are always kept
+        return [
+            job for job in jobs
+            if not job.get("link") or _hash_link(job["link"]) not in link_hashes
         ]
-        # Add any extra columns that might exist
-        existing_cols = [c for c in columns if c in df.columns]
-        remaining_cols = [c for c in df.columns if c not in columns and c != "description"]
+
+    def save_jobs_jsonl(self, jobs: List[JobEntry], filename: str = "jobs.jsonl") -> str:
+        """
+        Append jobs to a JSON Lines file, one full record (description included) per line.
         
-        # Save without description to keep CSV clean, or include it if needed
-        # For now, let's exclude description from main CSV to keep it lightweight
-        final_cols = existing_cols + remaining_cols
+        The file is append-only, so a save costs O(batch) regardless of its size.
+        """
+        filepath = os.path.join(self.output_dir, filename)
         
-        df[final_cols].to_csv(filepath, index=False)
+        with open(filepath, "a", encoding="utf-8", buffering=1024 * 1024) as f:
+            f.writelines(json_utils.dumps(job.to_dict()) + "\n" for job in jobs)
         return filepath
 
-    def save_jobs_master_csv(self, jobs: List[JobEntry]) -> str:
-        """Append jobs to master CSV."""
-        filepath = os.path.join(self.output_dir, "master_jobs.csv")
+    def _load_link_hashes(self, master_csv: str) -> Set[int]:
+        """
+        Load the master link hashes from the sidecar, or by rehashing the CSV
+        if the sidecar is missing or stale. Never writes any file.
+        """
+        if self._link_hashes is not None:
+            return self._link_hashes
+        
+        if not os.path.exists(master_csv):
+            # A leftover sidecar describes rows that no longer exist; it fails
+            # the fingerprint check once a new CSV is written
+            hashes = set()
+        else:
+            sidecar = b""
+            if os.path.exists(self._link_hashes_path):
+                with open(self._link_hashes_path, "rb") as f:
+                    sidecar = f.read()
+            
+            header_size = _LINK_SIDECAR_HEADER.size
+            if sidecar[:header_size] == _csv_fingerprint(master_csv):
+                hashes = {link_hash for (link_hash,) in struct.iter_unpack("<Q", sidecar[header_size:])}
+                self._link_hashes_synced = True
+            else:
+                # Sidecar is missing or describes another version of the CSV
+                # (edited elsewhere): rehash the links read-only; the next
+                # master save rewrites the sidecar
+                hashes, self._master_duplicates = self._scan_master_links(master_csv)
+        
+        self._link_hashes = hashes
+        return hashes
+
+    def _scan_master_links(self, master_csv: str) -> Tuple[Set[int], int]:
+        """Hash every link in the master CSV, counting rows that repeat an earlier link."""
+        hashes = set()
+        rows = 0
+        with open(master_csv, "r", newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            link_index = header.index("link") if "link" in header else len(header)
+            for row in reader:
+                rows += 1
+                hashes.add(_hash_link(row[link_index] if link_index < len(row) else None))
+        return hashes, rows - len(hashes)
+
+    def _write_link_hashes(self, master_csv: str, hashes: Set[int]) -> None:
+        """Rewrite master_links.bin from scratch for the current master CSV."""
+        with open(self._link_hashes_path, "wb") as f:
+            f.write(_csv_fingerprint(master_csv))
+            f.write(struct.pack(f"<{len(hashes)}Q", *hashes))
+        self._link_hashes_synced = True
+
+    def compact_master_csv(self) -> int:
+        """
+        Drop master CSV rows whose link appeared earlier in the file, and
+        rewrite the link-hash sidecar from the rows that remain.
+        
+        The file is streamed once and only replaced if duplicates were found.
+        save_jobs_master_csv calls this when a sidecar rebuild found duplicates.
         
-        new_df = pd.DataFrame([job.to_dict() for job in jobs])
+        Returns:
+            Number of duplicate rows removed
+        """
+        filepath = os.path.join(self.output_dir, "master_jobs.csv")
+        hashes = set()
+        removed = 0
         
         if os.path.exists(filepath):
-            existing_df = pd.read_csv(filepath)
-            combined_df = pd.concat([existing_df, new_df]).drop_duplicates(subset=["link"])
-        else:
-            combined_df = new_df
+            tmp_path = filepath + ".tmp"
+            with open(filepath, "r", newline="", encoding="utf-8") as src, \
+                    open(tmp_path, "w", newline="", encoding="utf-8") as dst:
+                reader = csv.reader(src)
+                writer = csv.writer(dst, lineterminator="\n")
+                header = next(reader, [])
+                writer.writerow(header)
+                link_index = header.index("link") if "link" in header else len(header)
+                
+                for row in reader:
+                    link_hash = _hash_link(row[link_index] if link_index < len(row) else None)
+                    if link_hash in hashes:
+                        removed += 1
+                        continue
+                    hashes.add(link_hash)
+                    writer.writerow(row)
             
-        combined_df.to_csv(filepath, index=False)
-        return filepath
+            if removed:
+                os.replace(tmp_path, filepath)
+            else:
+                os.remove(tmp_path)
+        
+        if os.path.exists(filepath):
+            self._write_link_hashes(filepath, hashes)
+        
+        self._link_hashes = hashes
+        self._master_duplicates = 0
+        return removed
 
     def save_jobs_markdown(self, jobs: List[JobEntry]) -> str:
         """Save jobs to Markdown file."""
         if not jobs:
             return ""
             
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"jobs_report_{timestamp}.md"
+        # One clock read, so the filename and the header date always agree
+        now = datetime.now()
+        filename = f"jobs_report_{now.strftime('%Y%m%d_%H%M%S')}.md"
         filepath = os.path.join(self.output_dir, "reports", filename)
         
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(f"# AI Jobs Report - {datetime.now().strftime('%Y-%m-%d')}\n\n")
+        # Large buffer: the report is written in many small pieces
+        with open(filepath, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+            f.write(f"# AI Jobs Report - {now.strftime('%Y-%m-%d')}\n\n")
             f.write(f"Total Jobs Found: {len(jobs)}\n\n")
             
-            # Group by category
-            df = pd.DataFrame([job.to_dict() for job in jobs])
-            if "category" in df.columns:
-                for category, group in df.groupby("category"):
-                    f.write(f"## {category} ({len(group)})\n\n")
-                    for _, job in group.iterrows():
-                        self._write_job_markdown(f, job)
-            else:
-                for job in jobs:
+            # Group by category, keeping crawl order within each group
+            groups = defaultdict(list)
+            for job in jobs:
+                groups[job.category or "Other"].append(job)
+            
+            for category in sorted(groups):
+                group = groups[category]
+                f.write(f"## {category} ({len(group)})\n\n")
+                for job in group:
                     self._write_job_markdown(f, job.to_dict())
                     
         return filepath
@@ -153,11 +380,11 @@ class JobStorage:
             return
             
         try:
-            # Read master CSV
-            df = pd.read_csv(master_csv)
-            
-            # Take the last N rows and reverse them (newest first)
-            latest_jobs = df.tail(limit).iloc[::-1]
+            # Stream the master CSV keeping only the last N rows. Rows can span
+            # several lines (quoted descriptions), so the file is parsed rather
+            # than tailed by line, but nothing beyond N rows is held in memory
+            with open(master_csv, "r", newline="", encoding="utf-8") as f:
+                latest_jobs = deque(csv.DictReader(f, restval=""), maxlen=limit)
             
             # Create Markdown Table
             table_lines = [
@@ -165,14 +392,13 @@ class JobStorage:
                 "|---|---|---|---|---|"
             ]
             
-            for _, job in latest_jobs.iterrows():
-                title = job.get('title', 'N/A')
-                # Escape pipes in title
-                title = str(title).replace("|", "-")
-                
-                company = str(job.get('company', 'N/A')).replace("|", "-")
-                location = str(job.get('location', 'N/A')).replace("|", "-")
-                posted = str(job.get('posted_date', 'N/A')).replace("|", "-")
+            # Newest first
+            for job in reversed(latest_jobs):
+                # Escape pipes in cell text
+                title = job.get('title', 'N/A').translate(_PIPE_ESCAPE)
+                company = job.get('company', 'N/A').translate(_PIPE_ESCAPE)
+                location = job.get('location', 'N/A').translate(_PIPE_ESCAPE)
+                posted = job.get('posted_date', 'N/A').translate(_PIPE_ESCAPE)
                 link = job.get('link', '#')
                 
                 row = f"| **{title}** | {company} | {location} | {posted} | [Apply]({link}) |"
@@ -184,15 +410,12 @@ class JobStorage:
             with open(readme_path, "r", encoding="utf-8") as f:
                 content = f.read()
                 
-            start_marker = "<!-- JOBS_TABLE_START -->"
-            end_marker = "<!-- JOBS_TABLE_END -->"
+            replacement = f"{_README_START_MARKER}\n{table_content}\n{_README_END_MARKER}"
+            # A function replacement keeps backslashes in job text literal
+            new_content, count = _README_TABLE_RE.subn(lambda _: replacement, content)
             
-            if start_marker in content and end_marker in content:
-                pattern = f"{re.escape(start_marker)}.*?{re.escape(end_marker)}"
-                replacement = f"{start_marker}\n{table_content}\n{end_marker}"
-                
-                new_content = re.sub(pattern, replacement, content, flags=re.DOTALL)
-                
+            # Skip the write when the table did not change
+            if count and new_content != content:
                 with open(readme_path, "w", encoding="utf-8") as f:
                     f.write(new_content)
                     
@@ -205,16 +428,37 @@ class JobStorage:
         if hasattr(job, 'to_dict'):
             job = job.to_dict()
             
-        f.write(f"### {job['title']}\n\n")
-        f.write(f"- **Company:** {job['company']}\n")
-        f.write(f"- **Posted Date:** {job['posted_date']}\n")
-        if job.get('salary') and job['salary'] != "Not mentioned":
-            f.write(f"- **Salary:** {job['salary']}\n")
-        f.write(f"- **Location:** {job['location']}\n")
-        f.write(f"- **Application Link:** [Apply Here]({job['link']})\n")
-        f.write(f"- **Source:** {job['source']}\n\n")
-        f.write("---\n\n")
+        # Assemble the entry and emit it with a single write
+        salary = job.get('salary')
+        salary_line = f"- **Salary:** {salary}\n" if salary and salary != "Not mentioned" else ""
+        f.write(
+            f"### {job['title']}\n\n"
+            f"- **Company:** {job['company']}\n"
+            f"- **Posted Date:** {job['posted_date']}\n"
+            f"{salary_line}"
+            f"- **Location:** {job['location']}\n"
+            f"- **Application Link:** [Apply Here]({job['link']})\n"
+            f"- **Source:** {job['source']}\n\n"
+            "---\n\n"
+        )
 
     def save_detailed_report(self, jobs: List[JobEntry]) -> str:
-        """Alias for save_jobs_markdown for now."""
-        return self.save_jobs_markdown(jobs)
+        """Save jobs to a Markdown report grouped by company, written section by section."""
+        if not jobs:
+            return ""
+        
+        now = datetime.now()
+        filename = f"jobs_detailed_{now.strftime('%Y%m%d_%H%M%S')}.md"
+        filepath = os.path.join(self.output_dir, "reports", filename)
+        
+        with open(filepath, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+            f.write(f"# AI Jobs Detailed Report - {now.strftime('%Y-%m-%d')}\n\n")
+            f.write(f"Total Jobs Found: {len(jobs)}\n\n")
+            
+            # Stable sort, so each company keeps its crawl order
+            for company, group in itertools.groupby(sorted(jobs, key=_company_key), key=_company_key):
+                f.write(f"## {company or 'Unknown'}\n\n")
+                for job in group:
+                    self._write_job_markdown(f, job.to_dict())
+        
+        return filepath
@@ -4,23 +4,78 @@ document.addEventListener('DOMContentLoaded', () => {
     const statsDiv = document.getElementById('jobStats');
     
     let allJobs = [];
+    let loadWarning = '';
 
-    // Fetch jobs data
-    fetch('jobs.json')
-        .then(response => response.json())
-        .then(data => {
-            allJobs = data;
-            renderJobs(allJobs);
-            updateStats(allJobs.length);
+    // Fetch jobs data: the shard index first. Only a site built with
+    // `generate_static_site.py --full` (no index.json) uses jobs.json.
+    fetch('index.json')
+        .then(response => {
+            if (response.status === 404) return null;
+            if (!response.ok) throw new Error(`index.json: HTTP ${response.status}`);
+            return response.json();
         })
+        .then(index => index ? loadShards(index.shards.slice().reverse()) : loadFullJson())
         .catch(error => {
             console.error('Error loading jobs:', error);
             container.innerHTML = '<p style="text-align:center; color: red;">Error loading job data. Please try again later.</p>';
         });
 
+    function loadFullJson() {
+        return fetch('jobs.json')
+            .then(response => {
+                if (!response.ok) throw new Error(`jobs.json: HTTP ${response.status}`);
+                return response.json();
+            })
+            .then(data => {
+                allJobs = data;
+                applySearch();
+            });
+    }
+
+    // Load NDJSON shards newest first, rendering as each one arrives while
+    // keeping allJobs in file order. A shard that fails to load, or a line
+    // that fails to parse, is skipped and reported instead of discarding
+    // everything loaded so far.
+    function loadShards(shards) {
+        let failedShards = 0;
+        let skippedLines = 0;
+        return shards.reduce((previous, shard) => previous
+            .then(() => fetch(shard.file))
+            .then(response => {
+                if (!response.ok) throw new Error(`${shard.file}: HTTP ${response.status}`);
+                return response.text();
+            })
+            .then(text => {
+                const jobs = [];
+                text.split('\n').forEach(line => {
+                    if (!line) return;
+                    try {
+                        jobs.push(JSON.parse(line));
+                    } catch (error) {
+                        skippedLines += 1;
+                    }
+                });
+                allJobs = jobs.concat(allJobs);
+                applySearch();
+            })
+            .catch(error => {
+                console.error('Error loading job shard:', error);
+                failedShards += 1;
+            }), Promise.resolve())
+            .then(() => {
+                if (failedShards || skippedLines) {
+                    loadWarning = ' (some job data could not be loaded)';
+                    console.warn(`${failedShards} shard(s) failed, ${skippedLines} line(s) skipped`);
+                    applySearch();
+                }
+            });
+    }
+
     // Search functionality
-    searchInput.addEventListener('input', (e) => {
-        const term = e.target.value.toLowerCase();
+    searchInput.addEventListener('input', applySearch);
+
+    function applySearch() {
+        const term = searchInput.value.toLowerCase();
         const filtered = allJobs.filter(job => 
             (job.title && job.title.toLowerCase().includes(term)) ||
             (job.company && job.company.toLowerCase().includes(term)) ||
@@ -28,10 +83,10 @@ document.addEventListener('DOMContentLoaded', () => {
         );
         renderJobs(filtered);
         updateStats(filtered.length);
-    });
+    }
 
     function updateStats(count) {
-        statsDiv.textContent = `${count} jobs found`;
+        statsDiv.textContent = `${count} jobs found${loadWarning}`;
     }
 
     function renderJobs(jobs) {
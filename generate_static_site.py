@@ -1,11 +1,35 @@
+import argparse
+import csv
+import hashlib
+import io
 import pandas as pd
 import os
-import json
 from datetime import datetime
 
-def generate_static_data():
+from utils import json_utils
+
+# Rows parsed per pandas chunk when converting the master CSV
+CSV_CHUNK_SIZE = 10_000
+
+# Every column is read as text (empty cells stay ""), so a value's type never
+# depends on which other rows share its chunk; _typed_records converts the
+# numeric and boolean columns explicitly
+CSV_READ_OPTIONS = {"dtype": str, "keep_default_na": False, "chunksize": CSV_CHUNK_SIZE}
+
+# Jobs per NDJSON shard; only the last shard is appended to
+SHARD_SIZE = 1_000
+
+# Bytes of the master CSV, ending at the last converted offset, whose hash is
+# kept in the index to detect a rewritten (e.g. compacted) CSV
+TAIL_CHECK_BYTES = 4096
+
+def generate_static_data(force: bool = False):
     """
     Reads the master jobs CSV and converts it to a JSON file for the static site.
+    
+    The conversion is skipped when the CSV has not changed since the last run
+    (its mtime is recorded in a ``.stamp`` file next to the output), unless
+    ``force`` is set.
     """
     # Paths
     jobs_file = os.path.join("jobs", "master_jobs.csv")
@@ -37,29 +61,165 @@ def generate_static_data():
                 "source": "Demo"
             }
         ]
-        with open(output_file, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write(json_utils.dumps(data, indent=True))
         print(f"Dummy data generated at {output_file}")
         return
 
+    stamp_file = output_file + ".stamp"
+    csv_mtime = str(os.path.getmtime(jobs_file))
+    if not force and os.path.exists(output_file) and os.path.exists(stamp_file):
+        with open(stamp_file, "r", encoding="utf-8") as f:
+            if f.read() == csv_mtime:
+                print(f"{output_file} is up-to-date with {jobs_file}; use --force to regenerate.")
+                return
+
     try:
-        # Read CSV
-        df = pd.read_csv(jobs_file)
-        
-        # Clean up data (handle NaNs)
-        df = df.fillna("")
-        
-        # Convert to list of dicts
-        jobs_data = df.to_dict(orient="records")
+        job_count = 0
         
-        # Save to JSON
+        # Stream the CSV in chunks and write each record as it is converted, so
+        # memory stays at one chunk instead of DataFrame + records + JSON text.
+        # The layout matches json.dump(records, indent=2).
         with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(jobs_data, f, indent=2, ensure_ascii=False)
+            f.write("[")
+            for record in _typed_records(pd.read_csv(jobs_file, **CSV_READ_OPTIONS)):
+                item = json_utils.dumps(record, indent=True)
+                f.write(",\n  " if job_count else "\n  ")
+                f.write(item.replace("\n", "\n  "))
+                job_count += 1
+            f.write("\n]" if job_count else "]")
+        
+        with open(stamp_file, "w", encoding="utf-8") as f:
+            f.write(csv_mtime)
             
-        print(f"Successfully generated {output_file} with {len(jobs_data)} jobs.")
+        print(f"Successfully generated {output_file} with {job_count} jobs.")
         
     except Exception as e:
         print(f"Error generating static data: {e}")
 
+def _csv_tail_digest(path, offset):
+    """Hash the TAIL_CHECK_BYTES of a file that end at offset."""
+    start = max(0, offset - TAIL_CHECK_BYTES)
+    with open(path, "rb") as f:
+        f.seek(start)
+        return hashlib.sha1(f.read(offset - start)).hexdigest()
+
+def _count_lines(path):
+    """Count the lines of a file, or -1 if it does not exist."""
+    if not os.path.exists(path):
+        return -1
+    with open(path, "rb") as f:
+        return sum(1 for _ in f)
+
+def _typed_records(chunks):
+    """Yield JSON-ready records from text-typed CSV chunks."""
+    for chunk in chunks:
+        for record in chunk.to_dict(orient="records"):
+            score = record.get("relevance_score")
+            if score:
+                try:
+                    record["relevance_score"] = float(score)
+                except ValueError:
+                    pass
+            relevant = record.get("is_relevant")
+            if relevant in ("True", "False"):
+                record["is_relevant"] = relevant == "True"
+            yield record
+
+def _read_csv_chunks(jobs_file, offset, end):
+    """Parse the master CSV rows between two byte offsets, in pandas chunks."""
+    if offset == 0:
+        return pd.read_csv(jobs_file, **CSV_READ_OPTIONS)
+    
+    with open(jobs_file, "r", newline="", encoding="utf-8") as f:
+        header = next(csv.reader(f))
+    with open(jobs_file, "rb") as f:
+        f.seek(offset)
+        appended = f.read(end - offset).decode("utf-8")
+    return pd.read_csv(io.StringIO(appended), header=None, names=header, **CSV_READ_OPTIONS)
+
+def generate_static_shards(force: bool = False):
+    """
+    Convert the master jobs CSV into NDJSON shards plus docs/index.json.
+    
+    The master CSV is append-only, so only the rows added since the last run
+    (tracked as a byte offset in the index) are converted and appended to the
+    last shard. A rewritten CSV, a damaged shard or ``force`` rebuilds all
+    shards from scratch.
+    """
+    jobs_file = os.path.join("jobs", "master_jobs.csv")
+    output_dir = "docs"
+    shard_dir = os.path.join(output_dir, "shards")
+    index_file = os.path.join(output_dir, "index.json")
+    
+    if not os.path.exists(jobs_file):
+        print(f"Error: {jobs_file} not found. Run the scraper first.")
+        return
+    
+    os.makedirs(shard_dir, exist_ok=True)
+    csv_size = os.path.getsize(jobs_file)
+    
+    index = None
+    if not force and os.path.exists(index_file):
+        with open(index_file, "r", encoding="utf-8") as f:
+            index = json_utils.loads(f.read())
+        
+        offset = index["source"]["offset"]
+        shards = index["shards"]
+        if (offset > csv_size
+                or _csv_tail_digest(jobs_file, offset) != index["source"]["tail_sha1"]
+                or (shards and _count_lines(os.path.join(output_dir, shards[-1]["file"])) != shards[-1]["count"])):
+            index = None
+    
+    if index is None:
+        # First run, --force, or the shards no longer match the CSV: start over
+        for name in os.listdir(shard_dir):
+            if name.endswith(".ndjson"):
+                os.remove(os.path.join(shard_dir, name))
+        index = {"count": 0, "shards": [], "source": {"offset": 0}}
+    
+    offset = index["source"]["offset"]
+    if offset == csv_size:
+        print(f"{index_file} is up-to-date with {jobs_file}.")
+        return
+    
+    shards = index["shards"]
+    new_count = 0
+    shard_file = None
+    try:
+        for record in _typed_records(_read_csv_chunks(jobs_file, offset, csv_size)):
+            if not shards or shards[-1]["count"] >= SHARD_SIZE:
+                shards.append({"file": f"shards/jobs-{len(shards):04d}.ndjson", "count": 0})
+                if shard_file is not None:
+                    shard_file.close()
+                    shard_file = None
+            if shard_file is None:
+                shard_file = open(os.path.join(output_dir, shards[-1]["file"]), "a", encoding="utf-8")
+            
+            shard_file.write(json_utils.dumps(record) + "\n")
+            shards[-1]["count"] += 1
+            new_count += 1
+    finally:
+        if shard_file is not None:
+            shard_file.close()
+    
+    index["count"] += new_count
+    index["source"] = {"offset": csv_size, "tail_sha1": _csv_tail_digest(jobs_file, csv_size)}
+    
+    # Replace the index atomically so the site never sees a partial file
+    tmp_file = index_file + ".tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        f.write(json_utils.dumps(index, indent=True))
+    os.replace(tmp_file, index_file)
+    
+    print(f"Added {new_count} jobs to {shard_dir} ({index['count']} jobs in {len(shards)} shards).")
+
 if __name__ == "__main__":
-    generate_static_data()
+    parser = argparse.ArgumentParser(description="Generate the static site data from the master jobs CSV.")
+    parser.add_argument("--full", action="store_true", help="Write the single docs/jobs.json instead of NDJSON shards")
+    parser.add_argument("--force", action="store_true", help="Regenerate everything even if the CSV is unchanged")
+    args = parser.parse_args()
+    if args.full:
+        generate_static_data(force=args.force)
+    else:
+        generate_static_shards(force=args.force)
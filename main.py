@@ -3,20 +3,29 @@ Main entry point for AI Jobs Scraper.
 Orchestrates crawling, filtering, and storage operations.
 """
 import asyncio
+import importlib
 import logging
-from typing import List
+from typing import Dict, List
 from datetime import datetime
 
 from config import get_settings, CRAWLER_SOURCES
-from crawlers.linkedin_crawler import LinkedInCrawler
-from crawlers.remoteok_crawler import RemoteOKCrawler
-from crawlers.weworkremotely_crawler import WeWorkRemotelyCrawler
-from crawlers.company_crawler import CompanyCrawler
+from crawlers.base_crawler import BaseCrawler
 from ai_filter.job_classifier import JobClassifier
 from data.job_entry import JobEntry, JobStorage
 from utils.logger import setup_logging
 
 
+# Crawler class per CRAWLER_SOURCES key as (module, class name). Modules are
+# only imported for enabled sources, so disabled crawlers (and their
+# dependencies, e.g. crawl4ai for LinkedIn) cost nothing at startup.
+CRAWLER_REGISTRY = {
+    "linkedin": ("crawlers.linkedin_crawler", "LinkedInCrawler"),
+    "remoteok": ("crawlers.remoteok_crawler", "RemoteOKCrawler"),
+    "weworkremotely": ("crawlers.weworkremotely_crawler", "WeWorkRemotelyCrawler"),
+    "company_portals": ("crawlers.company_crawler", "CompanyCrawler"),
+}
+
+
 class ScraperOrchestrator:
     """
     Orchestrates the complete scraping pipeline:
@@ -39,34 +48,22 @@ class ScraperOrchestrator:
         self._setup_crawlers()
     
     def _setup_crawlers(self):
-        """Set up available crawlers."""
-        try:
-            # Initialize LinkedIn crawler
-            if CRAWLER_SOURCES.get("linkedin", {}).get("enabled"):
-                linkedin_crawler = LinkedInCrawler()
-                self.crawlers.append(linkedin_crawler)
-                self.logger.info("LinkedIn crawler initialized")
-            
-            # Initialize RemoteOK crawler
-            if CRAWLER_SOURCES.get("remoteok", {}).get("enabled"):
-                remoteok_crawler = RemoteOKCrawler()
-                self.crawlers.append(remoteok_crawler)
-                self.logger.info("RemoteOK crawler initialized")
-
-            # Initialize WeWorkRemotely crawler
-            if CRAWLER_SOURCES.get("weworkremotely", {}).get("enabled"):
-                wwr_crawler = WeWorkRemotelyCrawler()
-                self.crawlers.append(wwr_crawler)
-                self.logger.info("WeWorkRemotely crawler initialized")
-
-            # Initialize Company Portal crawler
-            if CRAWLER_SOURCES.get("company_portals", {}).get("enabled"):
-                company_crawler = CompanyCrawler()
-                self.crawlers.append(company_crawler)
-                self.logger.info("Company Portal crawler initialized")
+        """Set up the crawlers for every enabled source."""
+        for source, source_config in CRAWLER_SOURCES.items():
+            if not source_config.get("enabled"):
+                continue
             
-        except Exception as e:
-            self.logger.error(f"Error setting up crawlers: {e}", exc_info=True)
+            if source not in CRAWLER_REGISTRY:
+                self.logger.warning(f"No crawler registered for enabled source '{source}'")
+                continue
+            
+            module_name, class_name = CRAWLER_REGISTRY[source]
+            try:
+                crawler_class = getattr(importlib.import_module(module_name), class_name)
+                self.crawlers.append(crawler_class())
+                self.logger.info(f"{class_name} initialized")
+            except Exception as e:
+                self.logger.error(f"Error setting up {class_name}: {e}", exc_info=True)
     
     async def run_scraping_pipeline(self) -> None:
         """
@@ -78,6 +75,8 @@ class ScraperOrchestrator:
         3. Store jobs in CSV and Markdown formats
         """
         all_jobs = []
+        # One timestamp per run, so the raw and filtered files of a run match
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         try:
             self.logger.info("=" * 60)
@@ -86,30 +85,20 @@ class ScraperOrchestrator:
             
             # Step 1: Crawl jobs from all sources
             self.logger.info("Step 1: Crawling jobs from sources...")
-            for crawler in self.crawlers:
-                try:
-                    self.logger.info(f"Crawling from {crawler.source_name}...")
-                    
-                    # Search for AI/ML jobs
-                    search_params = {
-                        "keywords": "AI Machine Learning Deep Learning Research Scientist",
-                        "location": "",  # All locations
-                        "date_posted": "r86400",  # Past 24 hours
-                        "max_pages": 1  # Start with 1 page for testing
-                    }
-                    
-                    jobs = await crawler.crawl(search_params=search_params)
-                    all_jobs.extend(jobs)
-                    
-                    self.logger.info(
-                        f"Retrieved {len(jobs)} jobs from {crawler.source_name}"
-                    )
-                    
-                except Exception as e:
-                    self.logger.error(
-                        f"Error crawling {crawler.source_name}: {e}",
-                        exc_info=True
-                    )
+            # Search for AI/ML jobs
+            search_params = {
+                "keywords": "AI Machine Learning Deep Learning Research Scientist",
+                "location": "",  # All locations
+                "date_posted": "r86400",  # Past 24 hours
+                "max_pages": 1  # Start with 1 page for testing
+            }
+            
+            # Sources are independent, so crawl them all at once
+            results = await asyncio.gather(
+                *(self._crawl_one(crawler, search_params) for crawler in self.crawlers)
+            )
+            for jobs in results:
+                all_jobs.extend(jobs)
             
             if not all_jobs:
                 self.logger.warning("No jobs retrieved from any source")
@@ -119,9 +108,10 @@ class ScraperOrchestrator:
             
             # Save raw jobs before filtering
             self.logger.info("Saving raw jobs before filtering...")
+            # Built once per job and reused for the relevant ones after classification
+            raw_job_entries = [JobEntry.from_job_dict(job) for job in all_jobs]
+            entries_by_job = {id(job): entry for job, entry in zip(all_jobs, raw_job_entries)}
             try:
-                raw_job_entries = [JobEntry.from_job_dict(job) for job in all_jobs]
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 raw_csv_path = self.storage.save_jobs_csv(
                     raw_job_entries, 
                     filename=f"raw_jobs_{timestamp}.csv",
@@ -131,6 +121,14 @@ class ScraperOrchestrator:
             except Exception as e:
                 self.logger.error(f"Error saving raw jobs: {e}", exc_info=True)
 
+            if self.settings.csv_output:
+                # Postings already in the master CSV were stored by an earlier run
+                all_jobs = self.storage.filter_new_jobs(all_jobs)
+                self.logger.info(f"New jobs not yet in master CSV: {len(all_jobs)}")
+                if not all_jobs:
+                    self.logger.info("No new jobs since the last run")
+                    return
+
             # Step 2: Filter jobs using AI classification
             self.logger.info("Step 2: Filtering jobs using AI classification...")
             try:
@@ -150,16 +148,17 @@ class ScraperOrchestrator:
             
             # Step 3: Convert to JobEntry objects
             self.logger.info("Step 3: Processing job entries...")
-            job_entries = [
-                JobEntry.from_job_dict(job) for job in relevant_jobs
-            ]
+            job_entries = []
+            for job in relevant_jobs:
+                entry = entries_by_job[id(job)]
+                entry.apply_classification(job.get("classification", {}))
+                job_entries.append(entry)
             
             # Step 4: Store jobs
             self.logger.info("Step 4: Storing jobs...")
             
             if self.settings.csv_output:
                 # Save individual run CSV
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 csv_path = self.storage.save_jobs_csv(
                     job_entries,
                     filename=f"filtered_jobs_{timestamp}.csv",
@@ -171,6 +170,10 @@ class ScraperOrchestrator:
                 master_csv_path = self.storage.save_jobs_master_csv(job_entries)
                 self.logger.info(f"Jobs stacked to master CSV: {master_csv_path}")
             
+            if self.settings.jsonl_output:
+                jsonl_path = self.storage.save_jobs_jsonl(job_entries)
+                self.logger.info(f"Jobs appended to JSONL: {jsonl_path}")
+            
             if self.settings.markdown_output:
                 md_path = self.storage.save_jobs_markdown(job_entries)
                 self.logger.info(f"Jobs saved to Markdown: {md_path}")
@@ -191,12 +194,38 @@ class ScraperOrchestrator:
         except Exception as e:
             self.logger.error(f"Error in scraping pipeline: {e}", exc_info=True)
             raise
+    
+    async def _crawl_one(self, crawler: BaseCrawler, search_params: Dict) -> List[Dict]:
+        """Run one crawler, logging and swallowing its errors so others continue."""
+        try:
+            self.logger.info(f"Crawling from {crawler.source_name}...")
+            
+            jobs = await crawler.crawl(search_params=search_params)
+            
+            self.logger.info(
+                f"Retrieved {len(jobs)} jobs from {crawler.source_name}"
+            )
+            return jobs
+            
+        except Exception as e:
+            self.logger.error(
+                f"Error crawling {crawler.source_name}: {e}",
+                exc_info=True
+            )
+            return []
+    
+    async def close(self) -> None:
+        """Release crawler resources (the shared HTTP session)."""
+        await BaseCrawler.close_session()
 
 
 async def main():
     """Main entry point."""
     orchestrator = ScraperOrchestrator()
-    await orchestrator.run_scraping_pipeline()
+    try:
+        await orchestrator.run_scraping_pipeline()
+    finally:
+        await orchestrator.close()
 
 
 if __name__ == "__main__":
@@ -4,10 +4,10 @@ Loads raw jobs from CSV and runs the AI filter on them.
 This is much faster than re-crawling.
 """
 import asyncio
+import csv
 import logging
 import os
 import glob
-import pandas as pd
 from typing import List, Dict
 
 from config import get_settings
@@ -35,12 +35,9 @@ class LocalJobProcessor:
     def load_jobs_from_csv(self, filepath: str) -> List[Dict]:
         """Load jobs from CSV and convert to list of dicts."""
         self.logger.info(f"Loading jobs from {filepath}...")
-        df = pd.read_csv(filepath)
-        
-        # Replace NaN with empty strings/defaults
-        df = df.fillna("")
-        
-        jobs = df.to_dict('records')
+        # Rows come straight out as dicts; empty cells and short rows become ""
+        with open(filepath, "r", newline="", encoding="utf-8") as f:
+            jobs = list(csv.DictReader(f, restval=""))
         return jobs
 
     def process(self):
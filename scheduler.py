@@ -4,9 +4,7 @@ Runs the scraping pipeline periodically (e.g., every hour).
 """
 import asyncio
 import logging
-import time
 from datetime import datetime
-import schedule
 from main import ScraperOrchestrator
 
 # Configure logging
@@ -20,40 +18,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger("scheduler")
 
-def run_job():
-    """Wrapper to run the async scraping pipeline synchronously for schedule."""
-    logger.info("Starting scheduled scraping job...")
-    try:
-        # Create a new event loop for each run to avoid closed loop issues
-        asyncio.run(run_pipeline())
-    except Exception as e:
-        logger.error(f"Scheduled job failed: {e}", exc_info=True)
+# Seconds between the starts of consecutive pipeline runs
+RUN_INTERVAL = 60 * 60
+
 
-async def run_pipeline():
-    """Run the scraping pipeline."""
+async def run_scheduler():
+    """
+    Run the scraping pipeline every hour on one long-lived event loop.
+    
+    The orchestrator (crawlers, classifier cache, shared HTTP session and
+    storage state) is built once and reused by every run.
+    """
+    loop = asyncio.get_running_loop()
     orchestrator = ScraperOrchestrator()
-    await orchestrator.run_scraping_pipeline()
+    try:
+        while True:
+            started = loop.time()
+            logger.info("Starting scheduled scraping job...")
+            try:
+                await orchestrator.run_scraping_pipeline()
+            except Exception as e:
+                logger.error(f"Scheduled job failed: {e}", exc_info=True)
+            
+            # Keep an hourly cadence regardless of how long the run took
+            await asyncio.sleep(max(0.0, RUN_INTERVAL - (loop.time() - started)))
+    finally:
+        await orchestrator.close()
 
 def main():
     """Main scheduler loop."""
     logger.info("Scheduler started. Job set to run every hour.")
     
-    # Run immediately on startup
-    run_job()
-    
-    # Schedule every hour
-    schedule.every(1).hours.do(run_job)
-    
-    while True:
-        try:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
-        except KeyboardInterrupt:
-            logger.info("Scheduler stopped by user.")
-            break
-        except Exception as e:
-            logger.error(f"Scheduler loop error: {e}", exc_info=True)
-            time.sleep(60)
+    try:
+        asyncio.run(run_scheduler())
+    except KeyboardInterrupt:
+        logger.info("Scheduler stopped by user.")
 
 if __name__ == "__main__":
     main()
@@ -9,7 +9,10 @@ async def main():
     
     crawler = CompanyCrawler()
     print("Starting Company Crawler...")
-    jobs = await crawler.crawl()
+    try:
+        jobs = await crawler.crawl()
+    finally:
+        await crawler.close_session()
     
     print(f"Total jobs found: {len(jobs)}")
     if jobs:
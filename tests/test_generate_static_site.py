@@ -0,0 +1,82 @@
+"""
+Tests for the static site shard generator.
+Run with: python -m unittest discover tests
+"""
+import csv
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import generate_static_site
+from utils import json_utils
+
+FIELDS = ["title", "company", "link", "posted_date", "relevance_score", "is_relevant"]
+
+
+def append_rows(path, rows):
+    """Append rows to a master CSV, writing the header for a new file."""
+    new_file = not os.path.exists(path)
+    with open(path, "a", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(FIELDS)
+        writer.writerows(rows)
+
+
+def read_shards(output_dir):
+    """Return every record from the shards listed in index.json, in order."""
+    with open(os.path.join(output_dir, "index.json"), "rb") as f:
+        index = json_utils.loads(f.read())
+    records = []
+    for shard in index["shards"]:
+        with open(os.path.join(output_dir, shard["file"]), "rb") as f:
+            records.extend(json_utils.loads(line) for line in f if line.strip())
+    return records
+
+
+class GenerateStaticShardsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._cwd = os.getcwd()
+        os.chdir(self._tmp.name)
+        os.makedirs("jobs")
+        self.jobs_file = os.path.join("jobs", "master_jobs.csv")
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    @mock.patch.object(generate_static_site, "SHARD_SIZE", 2)
+    def test_incremental_output_matches_full_rebuild(self):
+        append_rows(self.jobs_file, [
+            ["ML Engineer", "Alpha", "https://a/1", "2025-11-27", "0.9", "True"],
+            ["AI Engineer", "Beta", "https://b/1", "2025-11-26", "0.7", ""],
+            ["Data Scientist", "", "https://c/1", "2025-11-25", "0.7", ""],
+        ])
+        generate_static_site.generate_static_shards()
+
+        # Appended rows alone would infer int and float columns in pandas
+        append_rows(self.jobs_file, [
+            ["Research Scientist", "123", "https://d/1", "2025", "0.9", "True"],
+            ["NLP Engineer", "Gamma", "", "2024", "0.7", "False"],
+        ])
+        generate_static_site.generate_static_shards()
+        incremental = read_shards("docs")
+
+        generate_static_site.generate_static_shards(force=True)
+        rebuilt = read_shards("docs")
+
+        self.assertEqual(incremental, rebuilt)
+        self.assertEqual(len(rebuilt), 5)
+        self.assertEqual(rebuilt[3]["posted_date"], "2025")
+        self.assertEqual(rebuilt[3]["company"], "123")
+        self.assertEqual(rebuilt[3]["relevance_score"], 0.9)
+        self.assertIs(rebuilt[3]["is_relevant"], True)
+        self.assertIs(rebuilt[4]["is_relevant"], False)
+        self.assertEqual(rebuilt[4]["link"], "")
+        self.assertEqual(rebuilt[1]["is_relevant"], "")
+
+
+if __name__ == "__main__":
+    unittest.main()
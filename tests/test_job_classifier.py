@@ -0,0 +1,77 @@
+"""
+Tests for the keyword-based JobClassifier.
+Run with: python -m unittest discover tests
+"""
+import os
+import unittest
+
+# Settings requires an API key even though the keyword classifier never uses it
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+from ai_filter.job_classifier import JobClassifier
+
+
+class KeywordMatchingTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.classifier = JobClassifier()
+
+    def classify(self, title: str, description: str = "") -> dict:
+        return self.classifier.classify_job_relevance({"title": title, "description": description})
+
+    def assertRelevant(self, title: str, description: str = ""):
+        result = self.classify(title, description)
+        self.assertTrue(result["is_relevant"], f"{title!r}: {result['reasoning']}")
+
+    def assertNotRelevant(self, title: str, description: str = ""):
+        result = self.classify(title, description)
+        self.assertFalse(result["is_relevant"], f"{title!r}: {result['reasoning']}")
+
+    def test_whole_words(self):
+        self.assertRelevant("AI Engineer")
+        self.assertRelevant("Senior Machine Learning Engineer")
+        self.assertRelevant("Software Engineer", "You will build NLP pipelines.")
+
+    def test_plural_forms(self):
+        self.assertRelevant("Engineer, LLMs")
+        self.assertRelevant("Research Scientists")
+        self.assertRelevant("Software Engineer", "Experience with Large Language Models required.")
+
+    def test_acronym_compounds(self):
+        self.assertRelevant("GenAI Developer")
+        self.assertRelevant("MLOps Engineer")
+        self.assertRelevant("Senior Product Manager, AIOps")
+
+    def test_substrings_do_not_match(self):
+        self.assertNotRelevant("Blockchain Security Expert")
+        self.assertNotRelevant("Fulfillment Manager")
+        self.assertNotRelevant("HTML Developer")
+        self.assertNotRelevant("Software Engineer", "Please email us and maintain our services.")
+        self.assertNotRelevant("AML Investigator")
+
+    def test_all_caps_words_starting_with_acronyms(self):
+        self.assertNotRelevant("HOME HEALTH AIDE")
+        self.assertNotRelevant("AIRCRAFT MECHANIC")
+        self.assertNotRelevant("AIRPORT OPERATIONS")
+        self.assertNotRelevant("MLB Scout")
+        self.assertNotRelevant("Sr. Engineer - AIX Systems")
+        # All-caps acronyms on their own still count
+        self.assertRelevant("SENIOR AI ENGINEER")
+
+    def test_excluded_keywords(self):
+        result = self.classify("HRBP, AI Research")
+        self.assertFalse(result["is_relevant"])
+        self.assertEqual(result["reasoning"], "Contains excluded keyword in title: HRBP")
+        self.assertNotRelevant("AI Sales Lead")
+        self.assertNotRelevant("Technical Recruiters, ML")
+
+    def test_excluded_keyword_not_matched_inside_words(self):
+        self.assertRelevant("Chrome ML Engineer")
+
+    def test_tags_use_configured_spelling(self):
+        result = self.classify("MLOps and LLMs Engineer")
+        self.assertEqual(result["tags"], ["ML", "LLM"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+Tests for JobEntry and JobStorage.
+Run with: python -m unittest discover tests
+"""
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from data.job_entry import JobEntry, JobStorage
+
+
+def make_job(title: str, company, link: str) -> JobEntry:
+    """Build a minimal JobEntry for storage tests."""
+    return JobEntry(
+        title=title,
+        company=company,
+        location="Remote",
+        link=link,
+        posted_date="2025-11-27",
+        source="test"
+    )
+
+
+class SaveDetailedReportTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.storage = JobStorage(output_dir=self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_groups_by_company(self):
+        jobs = [
+            make_job("ML Engineer", "Beta", "https://b/1"),
+            make_job("AI Engineer", "Alpha", "https://a/1"),
+            make_job("Research Scientist", "Beta", "https://b/2"),
+        ]
+        path = self.storage.save_detailed_report(jobs)
+        with open(path, encoding="utf-8") as f:
+            report = f.read()
+
+        self.assertLess(report.index("## Alpha"), report.index("## Beta"))
+        # Crawl order is kept within a company
+        self.assertLess(report.index("### ML Engineer"), report.index("### Research Scientist"))
+
+    def test_none_company(self):
+        jobs = [
+            make_job("ML Engineer", None, "https://x/1"),
+            make_job("AI Engineer", "Alpha", "https://a/1"),
+        ]
+        path = self.storage.save_detailed_report(jobs)
+        with open(path, encoding="utf-8") as f:
+            report = f.read()
+
+        self.assertIn("## Unknown", report)
+        self.assertIn("## Alpha", report)
+
+
+class MasterLinkSidecarTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.output_dir = self._tmp.name
+        self.master_csv = os.path.join(self.output_dir, "master_jobs.csv")
+        JobStorage(self.output_dir).save_jobs_master_csv([
+            make_job("ML Engineer", "Alpha", "https://a/1"),
+            make_job("AI Engineer", "Beta", "https://b/1"),
+        ])
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_sidecar_survives_mtime_change(self):
+        # A fresh checkout gives every file a new mtime; the sidecar must still be used
+        future = time.time() + 3600
+        os.utime(self.master_csv, (future, future))
+        storage = JobStorage(self.output_dir)
+        with mock.patch.object(JobStorage, "compact_master_csv", side_effect=AssertionError):
+            storage.save_jobs_master_csv([make_job("NLP Engineer", "Gamma", "https://c/1")])
+
+        self.assertEqual(len(JobStorage(self.output_dir)._load_link_hashes(self.master_csv)), 3)
+
+    def test_sidecar_rebuilt_after_external_edit(self):
+        with open(self.master_csv, "a", encoding="utf-8") as f:
+            f.write("Data Scientist,Delta,Remote,https://d/1,,test,,,0.0,,Other,[],False\n")
+
+        storage = JobStorage(self.output_dir)
+        storage.save_jobs_master_csv([make_job("Data Scientist", "Delta", "https://d/1")])
+
+        with open(self.master_csv, encoding="utf-8") as f:
+            self.assertEqual(f.read().count("https://d/1"), 1)
+        self.assertEqual(len(JobStorage(self.output_dir)._load_link_hashes(self.master_csv)), 3)
+
+    def test_stale_sidecar_rebuild_does_not_rewrite_csv(self):
+        os.remove(os.path.join(self.output_dir, "master_links.bin"))
+        before = os.stat(self.master_csv)
+
+        storage = JobStorage(self.output_dir)
+        storage.save_jobs_master_csv([make_job("ML Engineer", "Alpha", "https://a/1")])
+
+        after = os.stat(self.master_csv)
+        self.assertEqual((before.st_ino, before.st_mtime_ns), (after.st_ino, after.st_mtime_ns))
+        self.assertTrue(os.path.exists(os.path.join(self.output_dir, "master_links.bin")))
+
+    def test_duplicates_compacted_on_save(self):
+        with open(self.master_csv, encoding="utf-8") as f:
+            rows = f.read().splitlines()
+        with open(self.master_csv, "a", encoding="utf-8") as f:
+            f.write(rows[1] + "\n")
+
+        JobStorage(self.output_dir).save_jobs_master_csv([])
+
+        with open(self.master_csv, encoding="utf-8") as f:
+            self.assertEqual(f.read().splitlines(), rows)
+
+
+class FilterNewJobsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.output_dir = self._tmp.name
+        self.master_csv = os.path.join(self.output_dir, "master_jobs.csv")
+        JobStorage(self.output_dir).save_jobs_master_csv([make_job("ML Engineer", "Alpha", "https://a/1")])
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_drops_known_links(self):
+        jobs = [{"link": "https://a/1"}, {"link": "https://new/1"}, {}]
+        new_jobs = JobStorage(self.output_dir).filter_new_jobs(jobs)
+        self.assertEqual(new_jobs, [{"link": "https://new/1"}, {}])
+
+    def test_keeps_linkless_jobs_after_one_was_saved(self):
+        storage = JobStorage(self.output_dir)
+        storage.save_jobs_master_csv([make_job("AI Engineer", "Custom", "")])
+
+        jobs = [{"title": "ML Engineer", "url": "https://custom/2"}, {"title": "NLP Engineer", "link": None}]
+        self.assertEqual(JobStorage(self.output_dir).filter_new_jobs(jobs), jobs)
+        self.assertEqual(storage.filter_new_jobs(jobs), jobs)
+
+    def test_does_not_write(self):
+        # Stale sidecar plus a duplicate row: a save would compact, a lookup must not
+        with open(self.master_csv, encoding="utf-8") as f:
+            rows = f.read().splitlines()
+        with open(self.master_csv, "a", encoding="utf-8") as f:
+            f.write(rows[1] + "\n")
+        os.remove(os.path.join(self.output_dir, "master_links.bin"))
+        with open(self.master_csv, "rb") as f:
+            before = f.read()
+
+        JobStorage(self.output_dir).filter_new_jobs([{"link": "https://a/1"}])
+
+        with open(self.master_csv, "rb") as f:
+            self.assertEqual(f.read(), before)
+        self.assertFalse(os.path.exists(os.path.join(self.output_dir, "master_links.bin")))
+
+
+if __name__ == "__main__":
+    unittest.main()
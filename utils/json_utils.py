@@ -0,0 +1,43 @@
+"""
+JSON helpers for the AI Jobs Scraper.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document.
+
+    Args:
+        data: Raw JSON as bytes (e.g. a response body) or str
+
+    Returns:
+        Decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Encode an object as JSON text.
+
+    Args:
+        obj: Object to encode
+        indent: Pretty-print with a two-space indent
+
+    Returns:
+        JSON string (non-ASCII characters are kept as-is)
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
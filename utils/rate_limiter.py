@@ -0,0 +1,52 @@
+"""
+Async rate limiting utilities for the AI Jobs Scraper.
+"""
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter for asyncio code.
+
+    Allows bursts of up to ``max_rate`` requests, refilling at
+    ``max_rate`` tokens per ``time_period`` seconds. Uses no loop-bound
+    primitives, so one instance can be shared across event loops
+    (e.g. successive ``asyncio.run`` calls from the scheduler).
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        """
+        Initialize the bucket full.
+
+        Args:
+            max_rate: Bucket capacity (maximum burst size)
+            time_period: Seconds over which ``max_rate`` tokens are refilled
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._refill_rate = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.max_rate, self._tokens + (now - self._updated) * self._refill_rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self._refill_rate)
+
+    async def __aenter__(self) -> "TokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None